@@ -0,0 +1,42 @@
+"""
+Benchmark of the construction of the Robust and Force environments, in environments created
+per second, with `gym.make` (default) and with the fast construction path (`fast=True`).
+
+    python benchmarks/construction.py --nb-envs 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import rrls.envs
+
+
+def envs_per_second(env_cls: type, nb_envs: int, **kwargs) -> float:
+    start = time.perf_counter()
+    for _ in range(nb_envs):
+        env_cls(**kwargs)
+    return nb_envs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nb-envs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'environment':<24}{'gym.make':>12}{'fast':>12}")
+    for name in rrls.envs.__all__:
+        env_cls = getattr(rrls.envs, name)
+        if not isinstance(env_cls, type) or not issubclass(
+            env_cls, rrls.envs._base.ModifiedParamsWrapper
+        ):
+            continue
+        env_cls(fast=True)  # Warm up the caches
+        default = envs_per_second(env_cls, args.nb_envs)
+        fast = envs_per_second(env_cls, args.nb_envs, fast=True)
+        print(f"{name:<24}{default:>12.0f}{fast:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
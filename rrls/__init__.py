@@ -1,21 +1,74 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from gymnasium.envs.registration import register
 
-from . import envs, wrappers
-from .evaluate import generate_evaluation_set
+if TYPE_CHECKING:
+    from . import envs, evaluate, wrappers
+    from .evaluate import (
+        EvaluationSet,
+        QuasiRandomEvaluationSet,
+        generate_evaluation_set,
+    )
 
 __all__ = [
     "envs",
+    "evaluate",
     "wrappers",
+    "EvaluationSet",
+    "QuasiRandomEvaluationSet",
     "generate_evaluation_set",
 ]
 
+# Submodules and attributes are imported on first access so that `import rrls`
+# (e.g. in a training worker only calling `gym.make`) stays cheap.
+_LAZY_SUBMODULES = {"envs", "evaluate", "wrappers"}
+_LAZY_ATTRIBUTES = {
+    "EvaluationSet": "evaluate",
+    "QuasiRandomEvaluationSet": "evaluate",
+    "generate_evaluation_set": "evaluate",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _load_entry_point(entry_point: Any) -> Any:
+    """
+    Resolves a `"module:attribute.path"` string to the object it names, any other value
+    is returned unchanged.
+    """
+    if not isinstance(entry_point, str):
+        return entry_point
+    module_name, attribute_path = entry_point.split(":")
+    obj = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
 
 def make_wrapped_env(cls_env, wrapper, **kwargs):
-    """ """
-    env = cls_env()
-    wrapped_env = wrapper(env=env, **kwargs)
+    """
+    Builds `cls_env` and wraps it with `wrapper`. `cls_env`, `wrapper` and `params_bound`
+    can be given as `"module:attribute"` strings so that registering the environments
+    does not import them.
+    """
+    if "params_bound" in kwargs:
+        kwargs["params_bound"] = _load_entry_point(kwargs["params_bound"])
+    env = _load_entry_point(cls_env)()
+    wrapped_env = _load_entry_point(wrapper)(env=env, **kwargs)
     return wrapped_env
 
 
@@ -102,9 +155,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHalfCheetah,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HalfCheetahParamsBound.THREE_DIM.value,
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -113,9 +166,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHalfCheetah,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HalfCheetahParamsBound.TWO_DIM.value,
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -124,9 +177,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHalfCheetah,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HalfCheetahParamsBound.ONE_DIM.value,
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.ONE_DIM.value",
         },
     )
     # Ant
@@ -136,9 +189,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustAnt,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.AntParamsBound.THREE_DIM.value,
+            "cls_env": "rrls.envs:RobustAnt",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:AntParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -147,9 +200,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustAnt,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.AntParamsBound.TWO_DIM.value,
+            "cls_env": "rrls.envs:RobustAnt",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:AntParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -158,9 +211,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustAnt,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.AntParamsBound.ONE_DIM.value,
+            "cls_env": "rrls.envs:RobustAnt",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:AntParamsBound.ONE_DIM.value",
         },
     )
     register(
@@ -169,9 +222,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceAnt,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.AntParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceAnt",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:AntParamsBound.RARL.value",
         },
     )
     register(
@@ -180,9 +233,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceHalfCheetah,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HalfCheetahParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceHalfCheetah",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.RARL.value",
         },
     )
     register(
@@ -191,9 +244,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceHopper,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HopperParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceHopper",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HopperParamsBound.RARL.value",
         },
     )
     register(
@@ -202,9 +255,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceHumanoidStandUp,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HumanoidStandupParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceHumanoidStandUp",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.RARL.value",
         },
     )
     register(
@@ -213,9 +266,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceInvertedPendulum,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.InvertedPendulumParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceInvertedPendulum",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:InvertedPendulumParamsBound.RARL.value",
         },
     )
     register(
@@ -224,9 +277,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.ForceWalker2d,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.Walker2dParamsBound.RARL.value,
+            "cls_env": "rrls.envs:ForceWalker2d",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:Walker2dParamsBound.RARL.value",
         },
     )
 
@@ -237,9 +290,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHopper,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HopperParamsBound.THREE_DIM.value,
+            "cls_env": "rrls.envs:RobustHopper",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HopperParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -248,9 +301,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHopper,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HopperParamsBound.TWO_DIM.value,
+            "cls_env": "rrls.envs:RobustHopper",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HopperParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -259,9 +312,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHopper,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HopperParamsBound.ONE_DIM.value,
+            "cls_env": "rrls.envs:RobustHopper",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HopperParamsBound.ONE_DIM.value",
         },
     )
 
@@ -272,9 +325,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHumanoidStandUp,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HumanoidStandupParamsBound.THREE_DIM.value,
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -283,9 +336,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHumanoidStandUp,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HumanoidStandupParamsBound.TWO_DIM.value,
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -294,9 +347,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "cls_env": envs.RobustHumanoidStandUp,
-            "wrapper": wrappers.DynamicAdversarial,
-            "params_bound": envs.HumanoidStandupParamsBound.ONE_DIM.value,
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.ONE_DIM.value",
         },
     )
 
@@ -308,9 +361,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DynamicAdversarial,
-            "cls_env": envs.RobustInvertedPendulum,
-            "params_bound": envs.InvertedPendulumParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "cls_env": "rrls.envs:RobustInvertedPendulum",
+            "params_bound": "rrls.envs:InvertedPendulumParamsBound.TWO_DIM.value",
         },
     )
 
@@ -320,9 +373,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DynamicAdversarial,
-            "cls_env": envs.RobustInvertedPendulum,
-            "params_bound": envs.InvertedPendulumParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DynamicAdversarial",
+            "cls_env": "rrls.envs:RobustInvertedPendulum",
+            "params_bound": "rrls.envs:InvertedPendulumParamsBound.ONE_DIM.value",
         },
     )
 
@@ -335,9 +388,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHalfCheetah,
-            "params_bound": envs.HalfCheetahParamsBound.THREE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -346,9 +399,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHalfCheetah,
-            "params_bound": envs.HalfCheetahParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -357,9 +410,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHalfCheetah,
-            "params_bound": envs.HalfCheetahParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHalfCheetah",
+            "params_bound": "rrls.envs:HalfCheetahParamsBound.ONE_DIM.value",
         },
     )
 
@@ -370,9 +423,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustAnt,
-            "params_bound": envs.AntParamsBound.THREE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustAnt",
+            "params_bound": "rrls.envs:AntParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -381,9 +434,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustAnt,
-            "params_bound": envs.AntParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustAnt",
+            "params_bound": "rrls.envs:AntParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -392,9 +445,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustAnt,
-            "params_bound": envs.AntParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustAnt",
+            "params_bound": "rrls.envs:AntParamsBound.ONE_DIM.value",
         },
     )
 
@@ -405,9 +458,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHopper,
-            "params_bound": envs.HopperParamsBound.THREE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHopper",
+            "params_bound": "rrls.envs:HopperParamsBound.THREE_DIM.value",
         },
     )
 
@@ -417,9 +470,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHopper,
-            "params_bound": envs.HopperParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHopper",
+            "params_bound": "rrls.envs:HopperParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -428,9 +481,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHopper,
-            "params_bound": envs.HopperParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHopper",
+            "params_bound": "rrls.envs:HopperParamsBound.ONE_DIM.value",
         },
     )
     # HumanoidStandUp
@@ -440,9 +493,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHumanoidStandUp,
-            "params_bound": envs.HumanoidStandupParamsBound.THREE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -451,9 +504,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHumanoidStandUp,
-            "params_bound": envs.HumanoidStandupParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -462,9 +515,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustHumanoidStandUp,
-            "params_bound": envs.HumanoidStandupParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
+            "params_bound": "rrls.envs:HumanoidStandupParamsBound.ONE_DIM.value",
         },
     )
     # InvertedPendulum
@@ -474,9 +527,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustInvertedPendulum,
-            "params_bound": envs.InvertedPendulumParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustInvertedPendulum",
+            "params_bound": "rrls.envs:InvertedPendulumParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -485,9 +538,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustInvertedPendulum,
-            "params_bound": envs.InvertedPendulumParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustInvertedPendulum",
+            "params_bound": "rrls.envs:InvertedPendulumParamsBound.ONE_DIM.value",
         },
     )
     # Walker2d
@@ -497,9 +550,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustWalker2d,
-            "params_bound": envs.Walker2dParamsBound.THREE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustWalker2d",
+            "params_bound": "rrls.envs:Walker2dParamsBound.THREE_DIM.value",
         },
     )
     register(
@@ -508,9 +561,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustWalker2d,
-            "params_bound": envs.Walker2dParamsBound.TWO_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustWalker2d",
+            "params_bound": "rrls.envs:Walker2dParamsBound.TWO_DIM.value",
         },
     )
     register(
@@ -519,9 +572,9 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.DomainRandomization,
-            "cls_env": envs.RobustWalker2d,
-            "params_bound": envs.Walker2dParamsBound.ONE_DIM.value,
+            "wrapper": "rrls.wrappers:DomainRandomization",
+            "cls_env": "rrls.envs:RobustWalker2d",
+            "params_bound": "rrls.envs:Walker2dParamsBound.ONE_DIM.value",
         },
     )
     register(
@@ -530,8 +583,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustHalfCheetah,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustHalfCheetah",
             "alpha": 0.1,
         },
     )
@@ -542,8 +595,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustAnt,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustAnt",
             "alpha": 0.1,
         },
     )
@@ -554,8 +607,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustHopper,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustHopper",
             "alpha": 0.1,
         },
     )
@@ -566,8 +619,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustHumanoidStandUp,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustHumanoidStandUp",
             "alpha": 0.1,
         },
     )
@@ -578,8 +631,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustInvertedPendulum,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustInvertedPendulum",
             "alpha": 0.1,
         },
     )
@@ -590,8 +643,8 @@ def register_robotics_envs():
         order_enforce=False,
         disable_env_checker=True,
         kwargs={
-            "wrapper": wrappers.ProbabilisticActionRobust,
-            "cls_env": envs.RobustWalker2d,
+            "wrapper": "rrls.wrappers:ProbabilisticActionRobust",
+            "cls_env": "rrls.envs:RobustWalker2d",
             "alpha": 0.1,
         },
     )
@@ -13,6 +13,8 @@ from .pendulum import (
     InvertedPendulumParamsBound,
     RobustInvertedPendulum,
 )
+from .schedule import ForcePulse, compile_force_schedule
+from .vector import RobustVectorEnv
 from .walker import ForceWalker2d, RobustWalker2d, Walker2dParamsBound
 
 __all__ = [
@@ -34,4 +36,7 @@ __all__ = [
     "ForceHumanoidStandUp",
     "ForceInvertedPendulum",
     "ForceWalker2d",
+    "RobustVectorEnv",
+    "ForcePulse",
+    "compile_force_schedule",
 ]
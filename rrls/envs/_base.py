@@ -0,0 +1,666 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import os
+from collections.abc import Sequence
+from functools import cache, partial
+from typing import Any, Callable, NamedTuple, Union
+
+import gymnasium as gym
+import mujoco
+import numpy as np
+from gymnasium import Wrapper
+from gymnasium.envs.mujoco.mujoco_env import MujocoEnv
+from gymnasium.envs.registration import EnvSpec, load_env_creator
+from gymnasium.wrappers import TimeLimit
+
+# From gymnasium 1.4, the offscreen framebuffer of a model is only grown to the size of the
+# environment, never shrunk below the size given by its XML
+_GROW_OFFSCREEN = tuple(int(part) for part in gym.__version__.split(".")[:2]) >= (1, 4)
+
+# Compiled MuJoCo models of the process, by path and modification time of their XML file
+_model_templates: dict[tuple[str, int], mujoco.MjModel] = {}
+
+
+def _model_from_template(xml_path: str) -> mujoco.MjModel:
+    # A copy of the model compiled from `xml_path`, the XML being compiled once per process
+    key = (xml_path, os.stat(xml_path).st_mtime_ns)
+    template = _model_templates.get(key)
+    if template is None:
+        template = mujoco.MjModel.from_xml_path(xml_path)
+        _model_templates[key] = template
+    return copy.copy(template)
+
+
+def _initialize_simulation_from_template(
+    env: MujocoEnv,
+) -> tuple[mujoco.MjModel, mujoco.MjData]:
+    # `MujocoEnv._initialize_simulation` of the installed gymnasium, copying the model from
+    # its template
+    model = _model_from_template(env.fullpath)
+    if _GROW_OFFSCREEN:
+        model.vis.global_.offwidth = max(model.vis.global_.offwidth, env.width)
+        model.vis.global_.offheight = max(model.vis.global_.offheight, env.height)
+    else:
+        model.vis.global_.offwidth = env.width
+        model.vis.global_.offheight = env.height
+    return model, mujoco.MjData(model)
+
+
+def _create_from_template(
+    env_creator: Callable[..., gym.Env], **kwargs: Any
+) -> gym.Env:
+    # Creates a MuJoCo environment whose model is copied from the template of its XML
+    if not (isinstance(env_creator, type) and issubclass(env_creator, MujocoEnv)):
+        return env_creator(**kwargs)
+    env = env_creator.__new__(env_creator)
+    env._initialize_simulation = partial(_initialize_simulation_from_template, env)
+    env.__init__(**kwargs)
+    del env._initialize_simulation
+    return env
+
+
+@cache
+def _env_creator(env_id: str) -> tuple[EnvSpec, Callable[..., gym.Env]]:
+    spec = gym.spec(env_id)
+    return spec, partial(_create_from_template, load_env_creator(spec.entry_point))
+
+
+def make_mujoco_env(env_id: str, fast: bool = False, **kwargs: Any) -> gym.Env:
+    """
+    Makes the MuJoCo environment wrapped by the Robust and Force environments. Each XML
+    file is compiled once per process into a template model, and the environments get a
+    copy of it instead of compiling the XML again.
+
+    Args:
+        env_id (str): The gymnasium id of the environment, e.g. `"Hopper-v5"`.
+        fast (bool): If False (default), the environment is made with `gym.make`. If True,
+            the environment class is instantiated directly, the registry lookup being done
+            once per id, and only wrapped in a `TimeLimit`, without the order enforcing and
+            passive checker wrappers of `gym.make`, which makes both the construction and
+            the steps faster.
+        **kwargs: Keyword arguments of the environment, and `max_episode_steps`.
+
+    Returns:
+        gym.Env: The environment.
+    """
+    spec, env_creator = _env_creator(env_id)
+    if not fast:
+        return gym.make(dataclasses.replace(spec, entry_point=env_creator), **kwargs)
+    max_episode_steps = kwargs.pop("max_episode_steps", spec.max_episode_steps)
+    env = env_creator(**{**spec.kwargs, **kwargs})
+    env.unwrapped.spec = spec
+    if max_episode_steps is None:
+        return env
+    return TimeLimit(env, max_episode_steps)
+
+
+class GeomBody(NamedTuple):
+    """
+    The body of the geom named `geom`, to refer by name to a body without a name of its own.
+    """
+
+    geom: str
+
+
+# Index of a parameter in its target array, e.g. `1`, `(1, 0)` or `(slice(None), 0)`. The
+# index of a body or a geom in its array can be given by its MuJoCo name, e.g. `"torso"` or
+# `("torso", 0)`, or by a `GeomBody`.
+Index = Union[int, str, GeomBody, tuple[Union[int, slice, str, GeomBody], ...]]
+
+# Type of the MuJoCo objects indexed by the first axis of the arrays, by array name prefix
+_OBJECT_TYPES = {
+    "body_": mujoco.mjtObj.mjOBJ_BODY,
+    "geom_": mujoco.mjtObj.mjOBJ_GEOM,
+    "xfrc_applied": mujoco.mjtObj.mjOBJ_BODY,
+}
+
+
+def _name2id(model: Any, array: str, name: str | GeomBody) -> int:
+    # Id of the object named `name` in the first axis of `array`
+    if isinstance(name, GeomBody):
+        return int(model.geom_bodyid[_name2id(model, "geom_", name.geom)])
+    object_type = next(
+        object_type
+        for prefix, object_type in _OBJECT_TYPES.items()
+        if array.startswith(prefix)
+    )
+    object_id = mujoco.mj_name2id(model, object_type, name)
+    if object_id < 0:
+        raise ValueError(f"No MuJoCo object named {name!r} for {array}")
+    return object_id
+
+
+def _resolve(model: Any, array: str, index: Index) -> tuple[int | slice, ...]:
+    # Index with the names replaced by the MuJoCo ids
+    index = (
+        index
+        if isinstance(index, tuple) and not isinstance(index, GeomBody)
+        else (index,)
+    )
+    return tuple(
+        _name2id(model, array, entry) if isinstance(entry, (str, GeomBody)) else entry
+        for entry in index
+    )
+
+
+class _Target(NamedTuple):
+    struct: str  # "model" or "data"
+    array: str  # e.g. "body_mass"
+    flat_indices: np.ndarray  # indices in the flattened target array
+    positions: np.ndarray  # position of the parameter written at each flat index
+
+
+class _BoundTarget(NamedTuple):
+    struct: str
+    array: np.ndarray  # view on the MuJoCo array
+    flat_indices: np.ndarray
+    positions: np.ndarray
+    values: np.ndarray  # preallocated buffer of the values written
+    is_set: np.ndarray  # preallocated buffer of the mask of set values
+    dirty: np.ndarray  # preallocated buffer of the mask of values to write
+    written: np.ndarray  # last value written at each flat index, NaN if unknown
+    merged: np.ndarray  # preallocated buffer of the entries after a partial write
+
+
+class BoundParamsBinding:
+    """
+    A `ParamsBinding` bound to the MuJoCo arrays of one environment, with preallocated
+    buffers so that writing the parameters does not allocate any array. It keeps the last
+    value written at each entry and only writes the entries whose value changed.
+    """
+
+    def __init__(self, targets: list[_Target], env: Any):
+        self.targets = [
+            _BoundTarget(
+                target.struct,
+                getattr(getattr(env, target.struct), target.array),
+                target.flat_indices,
+                target.positions,
+                np.empty(len(target.positions), dtype=np.float64),
+                np.empty(len(target.positions), dtype=bool),
+                np.empty(len(target.positions), dtype=bool),
+                np.full(len(target.positions), np.nan),
+                np.empty(len(target.positions), dtype=np.float64),
+            )
+            for target in targets
+        ]
+
+    def write(self, values: np.ndarray) -> int:
+        """
+        Writes the parameters to the MuJoCo arrays. NaN values, i.e. unset parameters, are
+        skipped and leave the target entry unchanged, as are the values equal to the last
+        ones written.
+
+        Args:
+            values (np.ndarray): The value of each parameter, in the order of the table.
+
+        Returns:
+            int: The number of entries written.
+        """
+        nb_written = 0
+        for target in self.targets:
+            np.take(values, target.positions, out=target.values)
+            np.isnan(target.values, out=target.is_set)
+            np.logical_not(target.is_set, out=target.is_set)
+            # NaN in `written` compares unequal, so unknown entries are always written
+            np.not_equal(target.values, target.written, out=target.dirty)
+            np.logical_and(target.dirty, target.is_set, out=target.dirty)
+            if target.dirty.all():
+                np.put(target.array, target.flat_indices, target.values)
+                np.copyto(target.written, target.values)
+                nb_written += len(target.dirty)
+            elif target.dirty.any():
+                # The current entries overwritten by the dirty values are put back whole,
+                # instead of masking the indices and values into new arrays
+                np.take(target.array, target.flat_indices, out=target.merged)
+                np.copyto(target.merged, target.values, where=target.dirty)
+                np.put(target.array, target.flat_indices, target.merged)
+                np.copyto(target.written, target.values, where=target.dirty)
+                nb_written += int(np.count_nonzero(target.dirty))
+        return nb_written
+
+    def invalidate(self, struct: str = "data"):
+        """
+        Forgets the values written to the arrays of `struct`, so that they are all written
+        again by the next call to `write`. MuJoCo resets the data arrays, e.g. the applied
+        forces, on every reset of the environment.
+
+        Args:
+            struct (str): `"model"` or `"data"`.
+        """
+        for target in self.targets:
+            if target.struct == struct:
+                target.written.fill(np.nan)
+
+
+class ParamsBinding:
+    """
+    A table mapping each parameter of an environment to the entries of the MuJoCo array it
+    is written to, the bodies and geoms being given by their MuJoCo name. It is compiled,
+    once per model layout, i.e. names and shape of the target arrays, into one array of
+    flat indices per target so that writing all the parameters costs one fancy-index
+    assignment per target array instead of one branch per parameter. The binding being a
+    class attribute, new environments of the same model, or of a custom XML with the same
+    names and layout, reuse the compiled indices without any name lookup.
+
+    Args:
+        table (dict[str, tuple[str, Index]]): For each parameter, in the order of the values
+            given to `write`, its target array as `"model.<name>"` or `"data.<name>"` and its
+            index in this array.
+    """
+
+    def __init__(self, table: dict[str, tuple[str, Index]]):
+        self.table = table
+        self.param_names = list(table.keys())
+        self._compiled: dict[tuple, list[_Target]] = {}
+
+    def _compile(self, env: Any) -> list[_Target]:
+        arrays = {
+            target: getattr(getattr(env, target.split(".")[0]), target.split(".")[1])
+            for target, _ in self.table.values()
+        }
+        model = env.model
+        key = (
+            model.names,
+            *((target, array.shape) for target, array in arrays.items()),
+        )
+        if key in self._compiled:
+            return self._compiled[key]
+
+        flat_indices: dict[str, list[np.ndarray]] = {target: [] for target in arrays}
+        positions: dict[str, list[np.ndarray]] = {target: [] for target in arrays}
+        for position, (target, index) in enumerate(self.table.values()):
+            shape = arrays[target].shape
+            index = _resolve(model, target.split(".")[1], index)
+            indices = np.arange(int(np.prod(shape))).reshape(shape)[index].ravel()
+            flat_indices[target].append(indices)
+            positions[target].append(np.full(len(indices), position))
+        compiled = [
+            _Target(
+                *target.split("."),
+                np.concatenate(flat_indices[target]),
+                np.concatenate(positions[target]),
+            )
+            for target in arrays
+        ]
+        self._compiled[key] = compiled
+        return compiled
+
+    def bind(self, env: Any) -> BoundParamsBinding:
+        """
+        Binds the table to the MuJoCo arrays of `env`.
+
+        Args:
+            env (Any): The unwrapped MuJoCo environment.
+        """
+        return BoundParamsBinding(self._compile(env), env)
+
+    def write(self, env: Any, values: np.ndarray):
+        """
+        Writes the parameters to the MuJoCo model and data of `env`, see
+        `BoundParamsBinding.write`.
+
+        Args:
+            env (Any): The unwrapped MuJoCo environment.
+            values (np.ndarray): The value of each parameter, in the order of the table.
+        """
+        self.bind(env).write(values)
+
+
+# Number of uint64 words of the state of the PCG64 generator of the environments
+_RNG_STATE_SIZE = 6
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _rng_state_words(generator: np.random.Generator) -> list[int]:
+    state = generator.bit_generator.state
+    if state["bit_generator"] != "PCG64":
+        raise TypeError(f"Unsupported bit generator {state['bit_generator']}")
+    return [
+        state["state"]["state"] & _UINT64_MASK,
+        state["state"]["state"] >> 64,
+        state["state"]["inc"] & _UINT64_MASK,
+        state["state"]["inc"] >> 64,
+        state["has_uint32"],
+        state["uinteger"],
+    ]
+
+
+def _set_rng_state_words(generator: np.random.Generator, words: np.ndarray):
+    state, state_hi, inc, inc_hi, has_uint32, uinteger = (int(word) for word in words)
+    generator.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": state | state_hi << 64, "inc": inc | inc_hi << 64},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+
+
+class _Param:
+    # Attribute of a parameter, stored at `position` in the parameters array of the env
+
+    def __init__(self, position: int):
+        self.position = position
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, env: Any, owner: type | None = None) -> Any:
+        if env is None:
+            return self
+        params = env.__dict__.get("_params")
+        if params is None:
+            raise AttributeError(self.name)
+        value = params[self.position]
+        return None if np.isnan(value) else float(value)
+
+    def __set__(self, env: Any, value: float | None):
+        env._params_array()[self.position] = np.nan if value is None else value
+
+
+class ModifiedParamsWrapper(Wrapper):
+    """
+    Base class of the Robust and Force environments. Subclasses declare their parameters
+    with a `ParamsBinding`, whose order is the `param_names` of the class. The parameters
+    are stored in a float64 array initialized from `_default_params`, NaN meaning that the
+    parameter is unset (None) and left unchanged in the simulator, and exposed as
+    attributes of the same name.
+
+    Only the parameters whose value changed since they were last written are written to the
+    simulator, and `model_writes` counts the MuJoCo array entries written since the last
+    reset.
+
+    Subclasses make the MuJoCo environment with `make_mujoco_env`, their `fast` argument
+    selecting its fast construction path.
+
+    Args:
+        env (gym.Env): The MuJoCo environment to wrap.
+        info_params (str): What the parameters add to the `info` dict. `"step"` (default)
+            adds each parameter under its name on every reset and step, `"reset"` only on
+            reset, `"none"` never, and `"array"` adds on every reset and step, under the
+            `"params"` key, one read-only view of the parameters array ordered as
+            `param_names`, which is updated in place and never reallocated.
+    """
+
+    INFO_PARAMS = ("step", "reset", "none", "array")
+
+    _binding: ParamsBinding
+    # Schedule of `xfrc_applied`, of shape (T, nbody, 6), and its step in the episode
+    _force_schedule: np.ndarray | None = None
+    _schedule_step: int = 0
+    # Value of the parameters before the first call to `set_params`, unset if missing
+    _default_params: dict[str, float] = {}
+    param_names: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        binding = cls.__dict__.get("_binding")
+        if binding is not None:
+            cls.param_names = tuple(binding.param_names)
+            for position, name in enumerate(binding.param_names):
+                param = _Param(position)
+                param.__set_name__(cls, name)
+                setattr(cls, name, param)
+
+    def __init__(self, env: Any, info_params: str = "step"):
+        if info_params not in self.INFO_PARAMS:
+            raise ValueError(
+                f"info_params must be one of {self.INFO_PARAMS}, got {info_params!r}"
+            )
+        super().__init__(env)
+        self.info_params = info_params
+        self.model_writes = 0
+
+    def _params_array(self) -> np.ndarray:
+        params = self.__dict__.get("_params")
+        if params is None:
+            params = np.array(
+                [self._default_params.get(name, np.nan) for name in self.param_names],
+                dtype=np.float64,
+            )
+            self._params = params
+        return params
+
+    def _bound_binding(self) -> BoundParamsBinding:
+        bound = self.__dict__.get("_bound")
+        if bound is None:
+            bound = self._binding.bind(self.unwrapped)
+            self._bound = bound
+        return bound
+
+    def _change_params(self):
+        self.model_writes += self._bound_binding().write(self._params_array())
+
+    def _params_view(self) -> np.ndarray:
+        view = self.__dict__.get("_view")
+        if view is None:
+            view = self._params_array().view()
+            view.flags.writeable = False
+            self._view = view
+        return view
+
+    def _update_info(self, info: dict[str, Any]):
+        if self.info_params == "array":
+            info["params"] = self._params_view()
+        elif self.info_params != "none":
+            info.update(self.get_params())
+
+    def reset(self, *, seed: int | None = None, options: dict | None = None):
+        self.model_writes = 0
+        if options is not None:
+            if "force_schedule" in options:
+                options = dict(options)
+                self.set_force_schedule(options.pop("force_schedule"))
+            self.set_params(**options)
+        obs, info = self.env.reset(seed=seed, options=options)
+        # The reset of MuJoCo zeroes the applied forces, which are written again
+        self._bound_binding().invalidate("data")
+        self._change_params()
+        self._schedule_step = 0
+        self._update_info(info)
+        return obs, info
+
+    def set_force_schedule(self, schedule: np.ndarray | Sequence[Any] | None):
+        """
+        Sets a schedule of the forces applied to the bodies, indexed by the step of the
+        episode. At each step, the row of the schedule of the current step is copied into
+        `xfrc_applied`, the last row being held once the schedule is over. The schedule is kept
+        across episodes until it is removed by setting it to None. While it is set, the
+        schedule replaces the forces given by the parameters. It can also be set at reset with
+        `reset(options={"force_schedule": schedule})`.
+
+        Args:
+            schedule (np.ndarray | Sequence[ForcePulse] | None): The schedule, of shape
+                `(T, nbody, 6)`, or force pulses compiled into a schedule lasting the maximum
+                number of steps of an episode, see `compile_force_schedule`.
+        """
+        if schedule is None:
+            self._force_schedule = None
+            # The parameters give the forces again, the bodies they do not cover having none
+            self.unwrapped.data.xfrc_applied.fill(0.0)
+            self._bound_binding().invalidate("data")
+            self._change_params()
+            return
+        model = self.unwrapped.model
+        if not isinstance(schedule, np.ndarray):
+            from .schedule import compile_force_schedule
+
+            time_limit = self._time_limit()
+            if time_limit is None:
+                raise ValueError("Force pulses need an environment with a time limit")
+            schedule = compile_force_schedule(
+                model, schedule, time_limit._max_episode_steps
+            )
+        if (
+            schedule.ndim != 3
+            or schedule.shape[1:] != (model.nbody, 6)
+            or not len(schedule)
+        ):
+            raise ValueError(
+                f"Expected a schedule of shape (T, {model.nbody}, 6), got {schedule.shape}"
+            )
+        self._force_schedule = np.ascontiguousarray(schedule, dtype=np.float64)
+
+    def _apply_force_schedule(self):
+        schedule = self._force_schedule
+        np.copyto(
+            self.unwrapped.data.xfrc_applied,
+            schedule[min(self._schedule_step, len(schedule) - 1)],
+        )
+        self._schedule_step += 1
+
+    def step(self, action):
+        if self._force_schedule is not None:
+            self._apply_force_schedule()
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        if self.info_params == "step" or self.info_params == "array":
+            self._update_info(info)
+        return obs, reward, terminated, truncated, info
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The bound binding holds views on the MuJoCo arrays and `_view` a view on the
+        # parameters array, they are rebuilt after a copy
+        state = self.__dict__.copy()
+        state.pop("_bound", None)
+        state.pop("_view", None)
+        return state
+
+    def set_params_array(self, values: np.ndarray):
+        """
+        Sets every parameter from an array ordered as `param_names`, NaN leaving the
+        parameter unset, and writes them to the simulator without going through keyword
+        arguments.
+
+        Args:
+            values (np.ndarray): The value of each parameter, of shape `(len(param_names),)`.
+        """
+        np.copyto(self._params_array(), values)
+        self._change_params()
+
+    def get_params_array(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns the parameters as an array ordered as `param_names`, NaN for unset parameters.
+
+        Args:
+            out (np.ndarray, optional): Preallocated float64 array of shape `(len(param_names),)`
+                the parameters are copied into.
+
+        Returns:
+            np.ndarray: `out`, or a new array if `out` is None.
+        """
+        if out is None:
+            return self._params_array().copy()
+        np.copyto(out, self._params_array())
+        return out
+
+    def _time_limit(self) -> TimeLimit | None:
+        env = self.env
+        while isinstance(env, Wrapper):
+            if isinstance(env, TimeLimit):
+                return env
+            env = env.env
+        return None
+
+    def _state_layout(self) -> dict[str, slice]:
+        layout = self.__dict__.get("_layout")
+        if layout is None:
+            model = self.unwrapped.model
+            sizes = {
+                "time": 1,
+                "elapsed_steps": 1,
+                "schedule_step": 1,
+                "qpos": model.nq,
+                "qvel": model.nv,
+                "act": model.na,
+                "qacc_warmstart": model.nv,
+                "xfrc_applied": model.nbody * 6,
+                "xpos": model.nbody * 3,
+                "rng": _RNG_STATE_SIZE,
+                "params": len(self.param_names),
+            }
+            layout, start = {}, 0
+            for name, size in sizes.items():
+                layout[name] = slice(start, start + size)
+                start += size
+            self._layout = layout
+        return layout
+
+    def get_state(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns a snapshot of the environment, to be restored with `set_state` on this
+        environment or on another instance of the same class. The snapshot is a float64
+        array holding the simulation time, the number of steps of the episode counted by the
+        time limit, the step of the force schedule, `qpos`,
+        `qvel`, `act`, `qacc_warmstart`, `xfrc_applied`, the body positions `xpos` (read by
+        some environments before stepping), the state of the random generator of the
+        environment (as raw uint64 words) and the parameters.
+
+        Args:
+            out (np.ndarray, optional): Preallocated float64 array the snapshot is copied into,
+                e.g. a previous snapshot of the environment.
+
+        Returns:
+            np.ndarray: `out`, or a new array if `out` is None.
+        """
+        layout = self._state_layout()
+        if out is None:
+            out = np.empty(layout["params"].stop, dtype=np.float64)
+        data = self.unwrapped.data
+        time_limit = self._time_limit()
+        elapsed_steps = None if time_limit is None else time_limit._elapsed_steps
+        out[layout["time"]] = data.time
+        out[layout["elapsed_steps"]] = (
+            np.nan if elapsed_steps is None else elapsed_steps
+        )
+        out[layout["schedule_step"]] = self._schedule_step
+        out[layout["qpos"]] = data.qpos
+        out[layout["qvel"]] = data.qvel
+        out[layout["act"]] = data.act
+        out[layout["qacc_warmstart"]] = data.qacc_warmstart
+        out[layout["xfrc_applied"]] = data.xfrc_applied.ravel()
+        out[layout["xpos"]] = data.xpos.ravel()
+        out[layout["rng"]].view(np.uint64)[:] = _rng_state_words(
+            self.unwrapped.np_random
+        )
+        out[layout["params"]] = self._params_array()
+        return out
+
+    def set_state(self, snapshot: np.ndarray):
+        """
+        Restores a snapshot returned by `get_state`, so that stepping the environment with the
+        same actions gives the same trajectory as from the snapshotted environment.
+
+        Args:
+            snapshot (np.ndarray): The snapshot, of an environment of the same class and model.
+        """
+        layout = self._state_layout()
+        if snapshot.shape != (layout["params"].stop,):
+            raise ValueError(
+                f"Expected a snapshot of shape {(layout['params'].stop,)}, got {snapshot.shape}"
+            )
+        unwrapped = self.unwrapped
+        model, data = unwrapped.model, unwrapped.data
+        self.set_params_array(snapshot[layout["params"]])
+        data.time = snapshot[layout["time"]][0]
+        data.qpos[:] = snapshot[layout["qpos"]]
+        data.qvel[:] = snapshot[layout["qvel"]]
+        data.act[:] = snapshot[layout["act"]]
+        data.xfrc_applied[:] = snapshot[layout["xfrc_applied"]].reshape(-1, 6)
+        # The applied forces may differ from the parameters if they were reset
+        self._bound_binding().invalidate("data")
+        mujoco.mj_forward(model, data)
+        data.qacc_warmstart[:] = snapshot[layout["qacc_warmstart"]]
+        data.xpos[:] = snapshot[layout["xpos"]].reshape(-1, 3)
+        _set_rng_state_words(
+            unwrapped.np_random, snapshot[layout["rng"]].view(np.uint64)
+        )
+        # Counted apart from the time limit, which the environment may not have
+        self._schedule_step = int(snapshot[layout["schedule_step"]][0])
+        time_limit = self._time_limit()
+        if time_limit is not None:
+            elapsed_steps = snapshot[layout["elapsed_steps"]][0]
+            time_limit._elapsed_steps = (
+                None if np.isnan(elapsed_steps) else int(elapsed_steps)
+            )
@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import GeomBody, ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 DEFAULT_PARAMS = {
     "torsomass": 0.32724923474893675,
@@ -46,7 +45,7 @@ class AntParamsBound(Enum):
     }
 
 
-class RobustAnt(Wrapper):
+class RobustAnt(ModifiedParamsWrapper):
     """
     Robust Ant environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -76,6 +75,25 @@ class RobustAnt(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "torsomass": ("model.body_mass", "torso"),
+            "frontleftlegmass": ("model.body_mass", "front_left_leg"),
+            "frontleftlegauxmass": ("model.body_mass", "aux_1"),
+            "frontleftleganklemass": ("model.body_mass", GeomBody("left_ankle_geom")),
+            "frontrightlegmass": ("model.body_mass", "front_right_leg"),
+            "frontrightlegauxmass": ("model.body_mass", "aux_2"),
+            "frontrightleganklemass": ("model.body_mass", GeomBody("right_ankle_geom")),
+            "backleftlegmass": ("model.body_mass", "back_leg"),
+            "backleftlegauxmass": ("model.body_mass", "aux_3"),
+            "backleftleganklemass": ("model.body_mass", GeomBody("third_ankle_geom")),
+            "backrightlegmass": ("model.body_mass", "right_back_leg"),
+            "backrightlegauxmass": ("model.body_mass", "aux_4"),
+            "backrightleganklemass": ("model.body_mass", GeomBody("fourth_ankle_geom")),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         torsomass: float | None = None,
@@ -91,9 +109,13 @@ class RobustAnt(Wrapper):
         backrightlegmass: float | None = None,
         backrightlegauxmass: float | None = None,
         backrightleganklemass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("Ant-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("Ant-v5", fast=fast, **kwargs), info_params=info_params
+        )
         self.set_params(
             torsomass=torsomass,
             frontleftlegmass=frontleftlegmass,
@@ -227,60 +249,8 @@ class RobustAnt(Wrapper):
             "backrightleganklemass": self.backrightleganklemass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
-
-    def _change_params(self):
-        if self.torsomass is not None:
-            self.unwrapped.model.body_mass[1] = self.torsomass  # type: ignore
-
-        if self.frontleftlegmass is not None:
-            self.unwrapped.model.body_mass[2] = self.frontleftlegmass  # type: ignore
-
-        if self.frontleftlegauxmass is not None:
-            self.unwrapped.model.body_mass[3] = self.frontleftlegauxmass  # type: ignore
-
-        if self.frontleftleganklemass is not None:
-            self.unwrapped.model.body_mass[4] = self.frontleftleganklemass  # type: ignore
-
-        if self.frontrightlegmass is not None:
-            self.unwrapped.model.body_mass[5] = self.frontrightlegmass  # type: ignore
-
-        if self.frontrightlegauxmass is not None:
-            self.unwrapped.model.body_mass[6] = self.frontrightlegauxmass  # type: ignore
-
-        if self.frontrightleganklemass is not None:
-            self.unwrapped.model.body_mass[7] = self.frontrightleganklemass  # type: ignore
-
-        if self.backleftlegmass is not None:
-            self.unwrapped.model.body_mass[8] = self.backleftlegmass  # type: ignore
-
-        if self.backleftlegauxmass is not None:
-            self.unwrapped.model.body_mass[9] = self.backleftlegauxmass  # type: ignore
-
-        if self.backleftleganklemass is not None:
-            self.unwrapped.model.body_mass[10] = self.backleftleganklemass  # type: ignore
-
-        if self.backrightlegmass is not None:
-            self.unwrapped.model.body_mass[11] = self.backrightlegmass  # type: ignore
-
-        if self.backrightlegauxmass is not None:
-            self.unwrapped.model.body_mass[12] = self.backrightlegauxmass  # type: ignore
 
-        if self.backrightleganklemass is not None:
-            self.unwrapped.model.body_mass[13] = self.backrightleganklemass  # type: ignore
-
-
-class ForceAnt(Wrapper):
+class ForceAnt(ModifiedParamsWrapper):
     """
     Force Ant environment. You can apply forces to the environment using the set_params method.
     The parameters are changed by calling the change_params method. The parameters are:
@@ -335,8 +305,92 @@ class ForceAnt(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("Ant-v5", **kwargs))  # type: ignore
+    _binding = ParamsBinding(
+        {
+            "torsoforce_x": ("data.xfrc_applied", ("torso", 0)),
+            "torsoforce_y": ("data.xfrc_applied", ("torso", 1)),
+            "torsoforce_z": ("data.xfrc_applied", ("torso", 2)),
+            "frontleftlegforce_x": ("data.xfrc_applied", ("front_left_leg", 0)),
+            "frontleftlegforce_y": ("data.xfrc_applied", ("front_left_leg", 1)),
+            "frontleftlegforce_z": ("data.xfrc_applied", ("front_left_leg", 2)),
+            "frontleftlegauxforce_x": ("data.xfrc_applied", ("aux_1", 0)),
+            "frontleftlegauxforce_y": ("data.xfrc_applied", ("aux_1", 1)),
+            "frontleftlegauxforce_z": ("data.xfrc_applied", ("aux_1", 2)),
+            "frontleftlegankleforce_x": (
+                "data.xfrc_applied",
+                (GeomBody("left_ankle_geom"), 0),
+            ),
+            "frontleftlegankleforce_y": (
+                "data.xfrc_applied",
+                (GeomBody("left_ankle_geom"), 1),
+            ),
+            "frontleftlegankleforce_z": (
+                "data.xfrc_applied",
+                (GeomBody("left_ankle_geom"), 2),
+            ),
+            "frontrightlegforce_x": ("data.xfrc_applied", ("front_right_leg", 0)),
+            "frontrightlegforce_y": ("data.xfrc_applied", ("front_right_leg", 1)),
+            "frontrightlegforce_z": ("data.xfrc_applied", ("front_right_leg", 2)),
+            "frontrightlegauxforce_x": ("data.xfrc_applied", ("aux_2", 0)),
+            "frontrightlegauxforce_y": ("data.xfrc_applied", ("aux_2", 1)),
+            "frontrightlegauxforce_z": ("data.xfrc_applied", ("aux_2", 2)),
+            "frontrightlegankleforce_x": (
+                "data.xfrc_applied",
+                (GeomBody("right_ankle_geom"), 0),
+            ),
+            "frontrightlegankleforce_y": (
+                "data.xfrc_applied",
+                (GeomBody("right_ankle_geom"), 1),
+            ),
+            "frontrightlegankleforce_z": (
+                "data.xfrc_applied",
+                (GeomBody("right_ankle_geom"), 2),
+            ),
+            "backleftlegforce_x": ("data.xfrc_applied", ("back_leg", 0)),
+            "backleftlegforce_y": ("data.xfrc_applied", ("back_leg", 1)),
+            "backleftlegforce_z": ("data.xfrc_applied", ("back_leg", 2)),
+            "backleftlegauxforce_x": ("data.xfrc_applied", ("aux_3", 0)),
+            "backleftlegauxforce_y": ("data.xfrc_applied", ("aux_3", 1)),
+            "backleftlegauxforce_z": ("data.xfrc_applied", ("aux_3", 2)),
+            "backleftlegankleforce_x": (
+                "data.xfrc_applied",
+                (GeomBody("third_ankle_geom"), 0),
+            ),
+            "backleftlegankleforce_y": (
+                "data.xfrc_applied",
+                (GeomBody("third_ankle_geom"), 1),
+            ),
+            "backleftlegankleforce_z": (
+                "data.xfrc_applied",
+                (GeomBody("third_ankle_geom"), 2),
+            ),
+            "backrightlegforce_x": ("data.xfrc_applied", ("right_back_leg", 0)),
+            "backrightlegforce_y": ("data.xfrc_applied", ("right_back_leg", 1)),
+            "backrightlegforce_z": ("data.xfrc_applied", ("right_back_leg", 2)),
+            "backrightlegauxforce_x": ("data.xfrc_applied", ("aux_4", 0)),
+            "backrightlegauxforce_y": ("data.xfrc_applied", ("aux_4", 1)),
+            "backrightlegauxforce_z": ("data.xfrc_applied", ("aux_4", 2)),
+            "backrightlegankleforce_x": (
+                "data.xfrc_applied",
+                (GeomBody("fourth_ankle_geom"), 0),
+            ),
+            "backrightlegankleforce_y": (
+                "data.xfrc_applied",
+                (GeomBody("fourth_ankle_geom"), 1),
+            ),
+            "backrightlegankleforce_z": (
+                "data.xfrc_applied",
+                (GeomBody("fourth_ankle_geom"), 2),
+            ),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("Ant-v5", fast=fast, **kwargs), info_params=info_params
+        )
         self.set_params()
 
     def set_params(
@@ -464,133 +518,3 @@ class ForceAnt(Wrapper):
             "backrightlegankleforce_y": self.backrightlegankleforce_y,
             "backrightlegankleforce_z": self.backrightlegankleforce_z,
         }
-
-    def _change_params(self):
-        if self.torsoforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1, 0] = self.torsoforce_x  # type: ignore
-
-        if self.torsoforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1, 1] = self.torsoforce_y  # type: ignore
-
-        if self.torsoforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1, 2] = self.torsoforce_z  # type: ignore
-
-        if self.frontleftlegforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2, 0] = self.frontleftlegforce_x  # type: ignore
-
-        if self.frontleftlegforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2, 1] = self.frontleftlegforce_y  # type: ignore
-
-        if self.frontleftlegforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2, 2] = self.frontleftlegforce_z  # type: ignore
-
-        if self.frontleftlegauxforce_x is not None:
-            self.unwrapped.data.xfrc_applied[3, 0] = self.frontleftlegauxforce_x  # type: ignore
-
-        if self.frontleftlegauxforce_y is not None:
-            self.unwrapped.data.xfrc_applied[3, 1] = self.frontleftlegauxforce_y  # type: ignore
-
-        if self.frontleftlegauxforce_z is not None:
-            self.unwrapped.data.xfrc_applied[3, 2] = self.frontleftlegauxforce_z  # type: ignore
-
-        if self.frontleftlegankleforce_x is not None:
-            self.unwrapped.data.xfrc_applied[4, 0] = self.frontleftlegankleforce_x  # type: ignore
-
-        if self.frontleftlegankleforce_y is not None:
-            self.unwrapped.data.xfrc_applied[4, 1] = self.frontleftlegankleforce_y  # type: ignore
-
-        if self.frontleftlegankleforce_z is not None:
-            self.unwrapped.data.xfrc_applied[4, 2] = self.frontleftlegankleforce_z  # type: ignore
-
-        if self.frontrightlegforce_x is not None:
-            self.unwrapped.data.xfrc_applied[5, 0] = self.frontrightlegforce_x  # type: ignore
-
-        if self.frontrightlegforce_y is not None:
-            self.unwrapped.data.xfrc_applied[5, 1] = self.frontrightlegforce_y  # type: ignore
-
-        if self.frontrightlegforce_z is not None:
-            self.unwrapped.data.xfrc_applied[5, 2] = self.frontrightlegforce_z  # type: ignore
-
-        if self.frontrightlegauxforce_x is not None:
-            self.unwrapped.data.xfrc_applied[6, 0] = self.frontrightlegauxforce_x  # type: ignore
-
-        if self.frontrightlegauxforce_y is not None:
-            self.unwrapped.data.xfrc_applied[6, 1] = self.frontrightlegauxforce_y  # type: ignore
-
-        if self.frontrightlegauxforce_z is not None:
-            self.unwrapped.data.xfrc_applied[6, 2] = self.frontrightlegauxforce_z  # type: ignore
-
-        if self.frontrightlegankleforce_x is not None:
-            self.unwrapped.data.xfrc_applied[7, 0] = self.frontrightlegankleforce_x  # type: ignore
-
-        if self.frontrightlegankleforce_y is not None:
-            self.unwrapped.data.xfrc_applied[7, 1] = self.frontrightlegankleforce_y  # type: ignore
-
-        if self.frontrightlegankleforce_z is not None:
-            self.unwrapped.data.xfrc_applied[7, 2] = self.frontrightlegankleforce_z  # type: ignore
-
-        if self.backleftlegforce_x is not None:
-            self.unwrapped.data.xfrc_applied[8, 0] = self.backleftlegforce_x  # type: ignore
-
-        if self.backleftlegforce_y is not None:
-            self.unwrapped.data.xfrc_applied[8, 1] = self.backleftlegforce_y  # type: ignore
-
-        if self.backleftlegforce_z is not None:
-            self.unwrapped.data.xfrc_applied[8, 2] = self.backleftlegforce_z  # type: ignore
-
-        if self.backleftlegauxforce_x is not None:
-            self.unwrapped.data.xfrc_applied[9, 0] = self.backleftlegauxforce_x  # type: ignore
-
-        if self.backleftlegauxforce_y is not None:
-            self.unwrapped.data.xfrc_applied[9, 1] = self.backleftlegauxforce_y  # type: ignore
-
-        if self.backleftlegauxforce_z is not None:
-            self.unwrapped.data.xfrc_applied[9, 2] = self.backleftlegauxforce_z  # type: ignore
-
-        if self.backleftlegankleforce_x is not None:
-            self.unwrapped.data.xfrc_applied[10, 0] = self.backleftlegankleforce_x  # type: ignore
-
-        if self.backleftlegankleforce_y is not None:
-            self.unwrapped.data.xfrc_applied[10, 1] = self.backleftlegankleforce_y  # type: ignore
-
-        if self.backleftlegankleforce_z is not None:
-            self.unwrapped.data.xfrc_applied[10, 2] = self.backleftlegankleforce_z  # type: ignore
-
-        if self.backrightlegforce_x is not None:
-            self.unwrapped.data.xfrc_applied[11, 0] = self.backrightlegforce_x  # type: ignore
-
-        if self.backrightlegforce_y is not None:
-            self.unwrapped.data.xfrc_applied[11, 1] = self.backrightlegforce_y  # type: ignore
-
-        if self.backrightlegforce_z is not None:
-            self.unwrapped.data.xfrc_applied[11, 2] = self.backrightlegforce_z  # type: ignore
-
-        if self.backrightlegauxforce_x is not None:
-            self.unwrapped.data.xfrc_applied[12, 0] = self.backrightlegauxforce_x  # type: ignore
-
-        if self.backrightlegauxforce_y is not None:
-            self.unwrapped.data.xfrc_applied[12, 1] = self.backrightlegauxforce_y  # type: ignore
-
-        if self.backrightlegauxforce_z is not None:
-            self.unwrapped.data.xfrc_applied[12, 2] = self.backrightlegauxforce_z  # type: ignore
-
-        if self.backrightlegankleforce_x is not None:
-            self.unwrapped.data.xfrc_applied[13, 0] = self.backrightlegankleforce_x  # type: ignore
-
-        if self.backrightlegankleforce_y is not None:
-            self.unwrapped.data.xfrc_applied[13, 1] = self.backrightlegankleforce_y  # type: ignore
-
-        if self.backrightlegankleforce_z is not None:
-            self.unwrapped.data.xfrc_applied[13, 2] = self.backrightlegankleforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 # from gymnasium.envs.mujoco.half_cheetah_v4 import HalfCheetahEnv
 
@@ -44,7 +43,7 @@ class HalfCheetahParamsBound(Enum):
     }
 
 
-class RobustHalfCheetah(Wrapper):
+class RobustHalfCheetah(ModifiedParamsWrapper):
     """
     Robust HalfCheetah environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -67,6 +66,20 @@ class RobustHalfCheetah(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "worldfriction": ("model.geom_friction", (slice(None), 0)),
+            "torsomass": ("model.body_mass", "torso"),
+            "backthighmass": ("model.body_mass", "bthigh"),
+            "backshinmass": ("model.body_mass", "bshin"),
+            "backfootmass": ("model.body_mass", "bfoot"),
+            "forwardthighmass": ("model.body_mass", "fthigh"),
+            "forwardshinmass": ("model.body_mass", "fshin"),
+            "forwardfootmass": ("model.body_mass", "ffoot"),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         worldfriction: float | None = None,
@@ -77,9 +90,14 @@ class RobustHalfCheetah(Wrapper):
         forwardthighmass: float | None = None,
         forwardshinmass: float | None = None,
         forwardfootmass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("HalfCheetah-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("HalfCheetah-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
 
         self.set_params(
             worldfriction=worldfriction,
@@ -158,38 +176,8 @@ class RobustHalfCheetah(Wrapper):
             "forwardfootmass": self.forwardfootmass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
 
-    def _change_params(self):
-        if self.worldfriction is not None:
-            self.unwrapped.model.geom_friction[:, 0] = self.worldfriction  # type: ignore
-        if self.torsomass is not None:
-            self.unwrapped.model.body_mass[1] = self.torsomass  # type: ignore
-        if self.backthighmass is not None:
-            self.unwrapped.model.body_mass[2] = self.backthighmass  # type: ignore
-        if self.backshinmass is not None:
-            self.unwrapped.model.body_mass[3] = self.backshinmass  # type: ignore
-        if self.backfootmass is not None:
-            self.unwrapped.model.body_mass[4] = self.backfootmass  # type: ignore
-        if self.forwardthighmass is not None:
-            self.unwrapped.model.body_mass[5] = self.forwardthighmass  # type: ignore
-        if self.forwardshinmass is not None:
-            self.unwrapped.model.body_mass[6] = self.forwardshinmass  # type: ignore
-        if self.forwardfootmass is not None:
-            self.unwrapped.model.body_mass[7] = self.forwardfootmass  # type: ignore
-
-
-class ForceHalfCheetah(Wrapper):
+class ForceHalfCheetah(ModifiedParamsWrapper):
     """
     Force HalfCheetah environment. You can apply forces to the robot using the env.data.xfrc_applied
     attribute. The parameters are:
@@ -224,8 +212,39 @@ class ForceHalfCheetah(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("HalfCheetah-v5", **kwargs))  # type: ignore
+    _binding = ParamsBinding(
+        {
+            "torsoforce_x": ("data.xfrc_applied", ("torso", 0)),
+            "torsoforce_y": ("data.xfrc_applied", ("torso", 1)),
+            "torsoforce_z": ("data.xfrc_applied", ("torso", 2)),
+            "backthighforce_x": ("data.xfrc_applied", ("bthigh", 0)),
+            "backthighforce_y": ("data.xfrc_applied", ("bthigh", 1)),
+            "backthighforce_z": ("data.xfrc_applied", ("bthigh", 2)),
+            "backshinforce_x": ("data.xfrc_applied", ("bshin", 0)),
+            "backshinforce_y": ("data.xfrc_applied", ("bshin", 1)),
+            "backshinforce_z": ("data.xfrc_applied", ("bshin", 2)),
+            "backfootforce_x": ("data.xfrc_applied", ("bfoot", 0)),
+            "backfootforce_y": ("data.xfrc_applied", ("bfoot", 1)),
+            "backfootforce_z": ("data.xfrc_applied", ("bfoot", 2)),
+            "forwardthighforce_x": ("data.xfrc_applied", ("fthigh", 0)),
+            "forwardthighforce_y": ("data.xfrc_applied", ("fthigh", 1)),
+            "forwardthighforce_z": ("data.xfrc_applied", ("fthigh", 2)),
+            "forwardshinforce_x": ("data.xfrc_applied", ("fshin", 0)),
+            "forwardshinforce_y": ("data.xfrc_applied", ("fshin", 1)),
+            "forwardshinforce_z": ("data.xfrc_applied", ("fshin", 2)),
+            "forwardfootforce_x": ("data.xfrc_applied", ("ffoot", 0)),
+            "forwardfootforce_y": ("data.xfrc_applied", ("ffoot", 1)),
+            "forwardfootforce_z": ("data.xfrc_applied", ("ffoot", 2)),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("HalfCheetah-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params()
         self._change_params()
 
@@ -300,59 +319,3 @@ class ForceHalfCheetah(Wrapper):
             "forwardfootforce_y": self.forwardfootforce_y,
             "forwardfootforce_z": self.forwardfootforce_z,
         }
-
-    def _change_params(self):
-        if self.torsoforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1, 0] = self.torsoforce_x  # type: ignore
-        if self.torsoforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1, 1] = self.torsoforce_y  # type: ignore
-        if self.torsoforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1, 2] = self.torsoforce_z  # type: ignore
-        if self.backthighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2, 0] = self.backthighforce_x  # type: ignore
-        if self.backthighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2, 1] = self.backthighforce_y  # type: ignore
-        if self.backthighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2, 2] = self.backthighforce_z  # type: ignore
-        if self.backshinforce_x is not None:
-            self.unwrapped.data.xfrc_applied[3, 0] = self.backshinforce_x  # type: ignore
-        if self.backshinforce_y is not None:
-            self.unwrapped.data.xfrc_applied[3, 1] = self.backshinforce_y  # type: ignore
-        if self.backshinforce_z is not None:
-            self.unwrapped.data.xfrc_applied[3, 2] = self.backshinforce_z  # type: ignore
-        if self.backfootforce_x is not None:
-            self.unwrapped.data.xfrc_applied[4, 0] = self.backfootforce_x  # type: ignore
-        if self.backfootforce_y is not None:
-            self.unwrapped.data.xfrc_applied[4, 1] = self.backfootforce_y  # type: ignore
-        if self.backfootforce_z is not None:
-            self.unwrapped.data.xfrc_applied[4, 2] = self.backfootforce_z  # type: ignore
-        if self.forwardthighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[5, 0] = self.forwardthighforce_x  # type: ignore
-        if self.forwardthighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[5, 1] = self.forwardthighforce_y  # type: ignore
-        if self.forwardthighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[5, 2] = self.forwardthighforce_z  # type: ignore
-        if self.forwardshinforce_x is not None:
-            self.unwrapped.data.xfrc_applied[6, 0] = self.forwardshinforce_x  # type: ignore
-        if self.forwardshinforce_y is not None:
-            self.unwrapped.data.xfrc_applied[6, 1] = self.forwardshinforce_y  # type: ignore
-        if self.forwardshinforce_z is not None:
-            self.unwrapped.data.xfrc_applied[6, 2] = self.forwardshinforce_z  # type: ignore
-        if self.forwardfootforce_x is not None:
-            self.unwrapped.data.xfrc_applied[7, 0] = self.forwardfootforce_x  # type: ignore
-        if self.forwardfootforce_y is not None:
-            self.unwrapped.data.xfrc_applied[7, 1] = self.forwardfootforce_y  # type: ignore
-        if self.forwardfootforce_z is not None:
-            self.unwrapped.data.xfrc_applied[7, 2] = self.forwardfootforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
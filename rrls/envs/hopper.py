@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 
 class HopperParamsBound(Enum):
@@ -35,7 +34,7 @@ DEFAULT_PARAMS = {
 }
 
 
-class RobustHopper(Wrapper):
+class RobustHopper(ModifiedParamsWrapper):
     """
     Robust Hopper environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -55,6 +54,17 @@ class RobustHopper(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "worldfriction": ("model.geom_friction", ("floor", 0)),
+            "torsomass": ("model.body_mass", "torso"),
+            "thighmass": ("model.body_mass", "thigh"),
+            "legmass": ("model.body_mass", "leg"),
+            "footmass": ("model.body_mass", "foot"),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         worldfriction: float | None = None,
@@ -62,9 +72,14 @@ class RobustHopper(Wrapper):
         thighmass: float | None = None,
         legmass: float | None = None,
         footmass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("Hopper-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("Hopper-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
 
         self.set_params(
             worldfriction=worldfriction,
@@ -120,36 +135,8 @@ class RobustHopper(Wrapper):
             "footmass": self.footmass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
-
-    def _change_params(self):
-        if self.worldfriction is not None:
-            self.unwrapped.model.geom_friction[0, 0] = self.worldfriction  # type: ignore
-
-        if self.torsomass is not None:
-            self.unwrapped.model.body_mass[1] = self.torsomass  # type: ignore
-
-        if self.thighmass is not None:
-            self.unwrapped.model.body_mass[2] = self.thighmass  # type: ignore
-
-        if self.legmass is not None:
-            self.unwrapped.model.body_mass[3] = self.legmass  # type: ignore
 
-        if self.footmass is not None:
-            self.unwrapped.model.body_mass[4] = self.footmass  # type: ignore
-
-
-class ForceHopper(Wrapper):
+class ForceHopper(ModifiedParamsWrapper):
     """
     Force Hopper environment. You can apply forces to the environment using the set_params method.
     The parameters are changed by calling the change_params method. The parameters are:
@@ -175,8 +162,30 @@ class ForceHopper(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("Hopper-v5", **kwargs))  # type: ignore
+    _binding = ParamsBinding(
+        {
+            "torsoforce_x": ("data.xfrc_applied", ("torso", 0)),
+            "torsoforce_y": ("data.xfrc_applied", ("torso", 1)),
+            "torsoforce_z": ("data.xfrc_applied", ("torso", 2)),
+            "thighforce_x": ("data.xfrc_applied", ("thigh", 0)),
+            "thighforce_y": ("data.xfrc_applied", ("thigh", 1)),
+            "thighforce_z": ("data.xfrc_applied", ("thigh", 2)),
+            "legforce_x": ("data.xfrc_applied", ("leg", 0)),
+            "legforce_y": ("data.xfrc_applied", ("leg", 1)),
+            "legforce_z": ("data.xfrc_applied", ("leg", 2)),
+            "footforce_x": ("data.xfrc_applied", ("foot", 0)),
+            "footforce_y": ("data.xfrc_applied", ("foot", 1)),
+            "footforce_z": ("data.xfrc_applied", ("foot", 2)),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("Hopper-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params()
 
     def set_params(
@@ -223,52 +232,3 @@ class ForceHopper(Wrapper):
             "footforce_y": self.footforce_y,
             "footforce_z": self.footforce_z,
         }
-
-    def _change_params(self):
-        if self.torsoforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1, 0] = self.torsoforce_x  # type: ignore
-
-        if self.torsoforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1, 1] = self.torsoforce_y  # type: ignore
-
-        if self.torsoforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1, 2] = self.torsoforce_z  # type: ignore
-
-        if self.thighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2, 0] = self.thighforce_x  # type: ignore
-
-        if self.thighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2, 1] = self.thighforce_y  # type: ignore
-
-        if self.thighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2, 2] = self.thighforce_z  # type: ignore
-
-        if self.legforce_x is not None:
-            self.unwrapped.data.xfrc_applied[3, 0] = self.legforce_x  # type: ignore
-
-        if self.legforce_y is not None:
-            self.unwrapped.data.xfrc_applied[3, 1] = self.legforce_y  # type: ignore
-
-        if self.legforce_z is not None:
-            self.unwrapped.data.xfrc_applied[3, 2] = self.legforce_z  # type: ignore
-
-        if self.footforce_x is not None:
-            self.unwrapped.data.xfrc_applied[4, 0] = self.footforce_x  # type: ignore
-
-        if self.footforce_y is not None:
-            self.unwrapped.data.xfrc_applied[4, 1] = self.footforce_y  # type: ignore
-
-        if self.footforce_z is not None:
-            self.unwrapped.data.xfrc_applied[4, 2] = self.footforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 DEFAULT_PARAMS = {
     "torsomass": 8.907462370478262,
@@ -46,7 +45,7 @@ class HumanoidStandupParamsBound(Enum):
     }
 
 
-class RobustHumanoidStandUp(Wrapper):
+class RobustHumanoidStandUp(ModifiedParamsWrapper):
     """
     Robust Humanoid environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -74,6 +73,25 @@ class RobustHumanoidStandUp(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "torsomass": ("model.body_mass", "torso"),
+            "lwaistmass": ("model.body_mass", "lwaist"),
+            "pelvismass": ("model.body_mass", "pelvis"),
+            "rightthighmass": ("model.body_mass", "right_thigh"),
+            "rightshinmass": ("model.body_mass", "right_shin"),
+            "rightfootmass": ("model.body_mass", "right_foot"),
+            "leftthighmass": ("model.body_mass", "left_thigh"),
+            "leftshinmass": ("model.body_mass", "left_shin"),
+            "leftfootmass": ("model.body_mass", "left_foot"),
+            "rightupperarmmass": ("model.body_mass", "right_upper_arm"),
+            "rightlowerarmmass": ("model.body_mass", "right_lower_arm"),
+            "leftupperarmmass": ("model.body_mass", "left_upper_arm"),
+            "leftlowerarmmass": ("model.body_mass", "left_lower_arm"),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         torsomass: float | None = None,
@@ -89,9 +107,14 @@ class RobustHumanoidStandUp(Wrapper):
         rightlowerarmmass: float | None = None,
         leftupperarmmass: float | None = None,
         leftlowerarmmass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("HumanoidStandup-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("HumanoidStandup-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
 
         self.set_params(
             torsomass=torsomass,
@@ -211,60 +234,8 @@ class RobustHumanoidStandUp(Wrapper):
             "leftlowerarmmass": self.leftlowerarmmass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
-
-    def _change_params(self):
-        if self.torsomass is not None:
-            self.unwrapped.model.body_mass[1] = self.torsomass  # type: ignore
-
-        if self.lwaistmass is not None:
-            self.unwrapped.model.body_mass[2] = self.lwaistmass  # type: ignore
-
-        if self.pelvismass is not None:
-            self.unwrapped.model.body_mass[3] = self.pelvismass  # type: ignore
-
-        if self.rightthighmass is not None:
-            self.unwrapped.model.body_mass[4] = self.rightthighmass  # type: ignore
-
-        if self.rightshinmass is not None:
-            self.unwrapped.model.body_mass[5] = self.rightshinmass  # type: ignore
-
-        if self.rightfootmass is not None:
-            self.unwrapped.model.body_mass[6] = self.rightfootmass  # type: ignore
-
-        if self.leftthighmass is not None:
-            self.unwrapped.model.body_mass[7] = self.leftthighmass  # type: ignore
-
-        if self.leftshinmass is not None:
-            self.unwrapped.model.body_mass[8] = self.leftshinmass  # type: ignore
-
-        if self.leftfootmass is not None:
-            self.unwrapped.model.body_mass[9] = self.leftfootmass  # type: ignore
-
-        if self.rightupperarmmass is not None:
-            self.unwrapped.model.body_mass[10] = self.rightupperarmmass  # type: ignore
-
-        if self.rightlowerarmmass is not None:
-            self.unwrapped.model.body_mass[11] = self.rightlowerarmmass  # type: ignore
-
-        if self.leftupperarmmass is not None:
-            self.unwrapped.model.body_mass[12] = self.leftupperarmmass  # type: ignore
 
-        if self.leftlowerarmmass is not None:
-            self.unwrapped.model.body_mass[13] = self.leftlowerarmmass  # type: ignore
-
-
-class ForceHumanoidStandUp(Wrapper):
+class ForceHumanoidStandUp(ModifiedParamsWrapper):
     """
     Force HumanoidStandUp environment. You can apply forces to the environment using the set_params method.
     The parameters are changed by calling the change_params method. The parameters are:
@@ -317,8 +288,57 @@ class ForceHumanoidStandUp(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("HumanoidStandup-v5", **kwargs))  # type: ignore # type: ignore
+    _binding = ParamsBinding(
+        {
+            "torsoforce_x": ("data.xfrc_applied", ("torso", 0)),
+            "torsoforce_y": ("data.xfrc_applied", ("torso", 1)),
+            "torsoforce_z": ("data.xfrc_applied", ("torso", 2)),
+            "lwaisforce_x": ("data.xfrc_applied", ("lwaist", 0)),
+            "lwaisforce_y": ("data.xfrc_applied", ("lwaist", 1)),
+            "lwaisforce_z": ("data.xfrc_applied", ("lwaist", 2)),
+            "pelvisforce_x": ("data.xfrc_applied", ("pelvis", 0)),
+            "pelvisforce_y": ("data.xfrc_applied", ("pelvis", 1)),
+            "pelvisforce_z": ("data.xfrc_applied", ("pelvis", 2)),
+            "rightthighforce_x": ("data.xfrc_applied", ("right_thigh", 0)),
+            "rightthighforce_y": ("data.xfrc_applied", ("right_thigh", 1)),
+            "rightthighforce_z": ("data.xfrc_applied", ("right_thigh", 2)),
+            "rightshinforce_x": ("data.xfrc_applied", ("right_shin", 0)),
+            "rightshinforce_y": ("data.xfrc_applied", ("right_shin", 1)),
+            "rightshinforce_z": ("data.xfrc_applied", ("right_shin", 2)),
+            "rightfootforce_x": ("data.xfrc_applied", ("right_foot", 0)),
+            "rightfootforce_y": ("data.xfrc_applied", ("right_foot", 1)),
+            "rightfootforce_z": ("data.xfrc_applied", ("right_foot", 2)),
+            "leftthighforce_x": ("data.xfrc_applied", ("left_thigh", 0)),
+            "leftthighforce_y": ("data.xfrc_applied", ("left_thigh", 1)),
+            "leftthighforce_z": ("data.xfrc_applied", ("left_thigh", 2)),
+            "leftshinforce_x": ("data.xfrc_applied", ("left_shin", 0)),
+            "leftshinforce_y": ("data.xfrc_applied", ("left_shin", 1)),
+            "leftshinforce_z": ("data.xfrc_applied", ("left_shin", 2)),
+            "leftfootforce_x": ("data.xfrc_applied", ("left_foot", 0)),
+            "leftfootforce_y": ("data.xfrc_applied", ("left_foot", 1)),
+            "leftfootforce_z": ("data.xfrc_applied", ("left_foot", 2)),
+            "rightupperarmforce_x": ("data.xfrc_applied", ("right_upper_arm", 0)),
+            "rightupperarmforce_y": ("data.xfrc_applied", ("right_upper_arm", 1)),
+            "rightupperarmforce_z": ("data.xfrc_applied", ("right_upper_arm", 2)),
+            "rightlowerarmforce_x": ("data.xfrc_applied", ("right_lower_arm", 0)),
+            "rightlowerarmforce_y": ("data.xfrc_applied", ("right_lower_arm", 1)),
+            "rightlowerarmforce_z": ("data.xfrc_applied", ("right_lower_arm", 2)),
+            "leftupperarmforce_x": ("data.xfrc_applied", ("left_upper_arm", 0)),
+            "leftupperarmforce_y": ("data.xfrc_applied", ("left_upper_arm", 1)),
+            "leftupperarmforce_z": ("data.xfrc_applied", ("left_upper_arm", 2)),
+            "leftlowerarmforce_x": ("data.xfrc_applied", ("left_lower_arm", 0)),
+            "leftlowerarmforce_y": ("data.xfrc_applied", ("left_lower_arm", 1)),
+            "leftlowerarmforce_z": ("data.xfrc_applied", ("left_lower_arm", 2)),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("HumanoidStandup-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params()
 
     def set_params(
@@ -446,133 +466,3 @@ class ForceHumanoidStandUp(Wrapper):
             "leftlowerarmforce_y": self.leftlowerarmforce_y,
             "leftlowerarmforce_z": self.leftlowerarmforce_z,
         }
-
-    def _change_params(self):
-        if self.torsoforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1][0] = self.torsoforce_x  # type: ignore
-
-        if self.torsoforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1][1] = self.torsoforce_y  # type: ignore
-
-        if self.torsoforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1][2] = self.torsoforce_z  # type: ignore
-
-        if self.lwaisforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2][0] = self.lwaisforce_x  # type: ignore
-
-        if self.lwaisforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2][1] = self.lwaisforce_y  # type: ignore
-
-        if self.lwaisforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2][2] = self.lwaisforce_z  # type: ignore
-
-        if self.pelvisforce_x is not None:
-            self.unwrapped.data.xfrc_applied[3][0] = self.pelvisforce_x  # type: ignore
-
-        if self.pelvisforce_y is not None:
-            self.unwrapped.data.xfrc_applied[3][1] = self.pelvisforce_y  # type: ignore
-
-        if self.pelvisforce_z is not None:
-            self.unwrapped.data.xfrc_applied[3][2] = self.pelvisforce_z  # type: ignore
-
-        if self.rightthighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[4][0] = self.rightthighforce_x  # type: ignore
-
-        if self.rightthighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[4][1] = self.rightthighforce_y  # type: ignore
-
-        if self.rightthighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[4][2] = self.rightthighforce_z  # type: ignore
-
-        if self.rightshinforce_x is not None:
-            self.unwrapped.data.xfrc_applied[5][0] = self.rightshinforce_x  # type: ignore
-
-        if self.rightshinforce_y is not None:
-            self.unwrapped.data.xfrc_applied[5][1] = self.rightshinforce_y  # type: ignore
-
-        if self.rightshinforce_z is not None:
-            self.unwrapped.data.xfrc_applied[5][2] = self.rightshinforce_z  # type: ignore
-
-        if self.rightfootforce_x is not None:
-            self.unwrapped.data.xfrc_applied[6][0] = self.rightfootforce_x  # type: ignore
-
-        if self.rightfootforce_y is not None:
-            self.unwrapped.data.xfrc_applied[6][1] = self.rightfootforce_y  # type: ignore
-
-        if self.rightfootforce_z is not None:
-            self.unwrapped.data.xfrc_applied[6][2] = self.rightfootforce_z  # type: ignore
-
-        if self.leftthighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[7][0] = self.leftthighforce_x  # type: ignore
-
-        if self.leftthighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[7][1] = self.leftthighforce_y  # type: ignore
-
-        if self.leftthighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[7][2] = self.leftthighforce_z  # type: ignore
-
-        if self.leftshinforce_x is not None:
-            self.unwrapped.data.xfrc_applied[8][0] = self.leftshinforce_x  # type: ignore
-
-        if self.leftshinforce_y is not None:
-            self.unwrapped.data.xfrc_applied[8][1] = self.leftshinforce_y  # type: ignore
-
-        if self.leftshinforce_z is not None:
-            self.unwrapped.data.xfrc_applied[8][2] = self.leftshinforce_z  # type: ignore
-
-        if self.leftfootforce_x is not None:
-            self.unwrapped.data.xfrc_applied[9][0] = self.leftfootforce_x  # type: ignore
-
-        if self.leftfootforce_y is not None:
-            self.unwrapped.data.xfrc_applied[9][1] = self.leftfootforce_y  # type: ignore
-
-        if self.leftfootforce_z is not None:
-            self.unwrapped.data.xfrc_applied[9][2] = self.leftfootforce_z  # type: ignore
-
-        if self.rightupperarmforce_x is not None:
-            self.unwrapped.data.xfrc_applied[10][0] = self.rightupperarmforce_x  # type: ignore
-
-        if self.rightupperarmforce_y is not None:
-            self.unwrapped.data.xfrc_applied[10][1] = self.rightupperarmforce_y  # type: ignore
-
-        if self.rightupperarmforce_z is not None:
-            self.unwrapped.data.xfrc_applied[10][2] = self.rightupperarmforce_z  # type: ignore
-
-        if self.rightlowerarmforce_x is not None:
-            self.unwrapped.data.xfrc_applied[11][0] = self.rightlowerarmforce_x  # type: ignore
-
-        if self.rightlowerarmforce_y is not None:
-            self.unwrapped.data.xfrc_applied[11][1] = self.rightlowerarmforce_y  # type: ignore
-
-        if self.rightlowerarmforce_z is not None:
-            self.unwrapped.data.xfrc_applied[11][2] = self.rightlowerarmforce_z  # type: ignore
-
-        if self.leftupperarmforce_x is not None:
-            self.unwrapped.data.xfrc_applied[12][0] = self.leftupperarmforce_x  # type: ignore
-
-        if self.leftupperarmforce_y is not None:
-            self.unwrapped.data.xfrc_applied[12][1] = self.leftupperarmforce_y  # type: ignore
-
-        if self.leftupperarmforce_z is not None:
-            self.unwrapped.data.xfrc_applied[12][2] = self.leftupperarmforce_z  # type: ignore
-
-        if self.leftlowerarmforce_x is not None:
-            self.unwrapped.data.xfrc_applied[13][0] = self.leftlowerarmforce_x  # type: ignore
-
-        if self.leftlowerarmforce_y is not None:
-            self.unwrapped.data.xfrc_applied[13][1] = self.leftlowerarmforce_y  # type: ignore
-
-        if self.leftlowerarmforce_z is not None:
-            self.unwrapped.data.xfrc_applied[13][2] = self.leftlowerarmforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
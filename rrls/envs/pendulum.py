@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 DEFAULT_PARAMS = {
     "polemass": 10.47197551196598,
@@ -26,7 +25,7 @@ class InvertedPendulumParamsBound(Enum):
     }
 
 
-class RobustInvertedPendulum(Wrapper):
+class RobustInvertedPendulum(ModifiedParamsWrapper):
     """
     Robust Inverted Pendulum environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -43,13 +42,26 @@ class RobustInvertedPendulum(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "polemass": ("model.body_mass", "pole"),
+            "cartmass": ("model.body_mass", "cart"),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         polemass: float | None = None,
         cartmass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("InvertedPendulum-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("InvertedPendulum-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params(polemass=polemass, cartmass=cartmass)
 
     def set_params(self, polemass: float | None = None, cartmass: float | None = None):
@@ -71,26 +83,8 @@ class RobustInvertedPendulum(Wrapper):
             "cartmass": self.cartmass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
-
-    def _change_params(self):
-        if self.cartmass is not None:
-            self.unwrapped.model.body_mass[1] = self.cartmass  # type: ignore
-        if self.polemass is not None:
-            self.unwrapped.model.body_mass[2] = self.polemass  # type: ignore
-
 
-class ForceInvertedPendulum(Wrapper):
+class ForceInvertedPendulum(ModifiedParamsWrapper):
     """
     Force InvertedPendulum environment. You can apply forces to the environment using the set_params method.
     The parameters are changed by calling the change_params method. The parameters are:
@@ -106,8 +100,24 @@ class ForceInvertedPendulum(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("InvertedPendulum-v5", **kwargs))  # type: ignore
+    _binding = ParamsBinding(
+        {
+            "poleforce_x": ("data.xfrc_applied", ("pole", 0)),
+            "poleforce_y": ("data.xfrc_applied", ("pole", 1)),
+            "poleforce_z": ("data.xfrc_applied", ("pole", 2)),
+            "cartforce_x": ("data.xfrc_applied", ("cart", 0)),
+            "cartforce_y": ("data.xfrc_applied", ("cart", 1)),
+            "cartforce_z": ("data.xfrc_applied", ("cart", 2)),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("InvertedPendulum-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params()
 
     def set_params(
@@ -136,29 +146,3 @@ class ForceInvertedPendulum(Wrapper):
             "cartforce_y": self.cartforce_y,
             "cartforce_z": self.cartforce_z,
         }
-
-    def _change_params(self):
-        if self.cartforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1, 0] = self.cartforce_x  # type: ignore
-        if self.cartforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1, 1] = self.cartforce_y  # type: ignore
-        if self.cartforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1, 2] = self.cartforce_z  # type: ignore
-        if self.poleforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2, 0] = self.poleforce_x  # type: ignore
-        if self.poleforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2, 1] = self.poleforce_y  # type: ignore
-        if self.poleforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2, 2] = self.poleforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
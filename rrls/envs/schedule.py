@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from ._base import GeomBody, _name2id
+
+
+class ForcePulse(NamedTuple):
+    """
+    Procedural specification of a force applied to a body for some steps of the episode,
+    e.g. an impulse (`duration=1`), a gust (`duration > 1`) or a periodic push (`period`).
+
+    Args:
+        body (str | GeomBody): The MuJoCo name of the body.
+        force (Sequence[float]): The 6 components of `xfrc_applied`, the force then the torque.
+        start (int): The first step the force is applied at.
+        duration (int): The number of consecutive steps the force is applied for.
+        period (int, optional): If given, the pulse is repeated every `period` steps.
+    """
+
+    body: str | GeomBody
+    force: Sequence[float]
+    start: int = 0
+    duration: int = 1
+    period: int | None = None
+
+
+def compile_force_schedule(
+    model: Any, pulses: Sequence[ForcePulse], horizon: int
+) -> np.ndarray:
+    """
+    Compiles force pulses into a schedule of `xfrc_applied`, the forces of pulses applied at
+    the same step to the same body being summed.
+
+    Args:
+        model (mujoco.MjModel): The MuJoCo model the schedule is for.
+        pulses (Sequence[ForcePulse]): The force pulses.
+        horizon (int): The number of steps of the schedule.
+
+    Returns:
+        np.ndarray: The schedule, of shape `(horizon, model.nbody, 6)`.
+    """
+    schedule = np.zeros((horizon, model.nbody, 6), dtype=np.float64)
+    for pulse in pulses:
+        body = _name2id(model, "xfrc_applied", pulse.body)
+        period = horizon if pulse.period is None else pulse.period
+        for start in range(pulse.start, horizon, period):
+            schedule[start : start + pulse.duration, body] += pulse.force
+    return schedule
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+from gymnasium.vector import VectorEnv
+from gymnasium.vector.utils import batch_space, create_empty_array
+
+from ._base import ModifiedParamsWrapper
+
+try:
+    from gymnasium.vector import AutoresetMode
+except (
+    ImportError
+):  # gymnasium < 1.1, whose vector environments all autoreset on the next step
+    AutoresetMode = None
+
+
+class RobustVectorEnv(VectorEnv):
+    """
+    Vector environment of `num_envs` instances of a Robust or Force environment class, each
+    with its own MuJoCo model and parameters. The sub-environments are stepped in one call
+    without going through the gymnasium wrappers, the observations, rewards, terminations
+    and truncations being written into preallocated arrays of shape `(num_envs, ...)`.
+
+    The parameters of the sub-environments are the rows of one `(num_envs, n_params)`
+    matrix, ordered as the `param_names` of the class, NaN meaning unset, so that setting
+    the parameters of every sub-environment, e.g. for domain randomization, is one batched
+    copy into the matrix. The MuJoCo models being separate, the changed entries are then
+    written to each model in turn, one `ModifiedParamsWrapper._change_params` call per
+    sub-environment. They are kept across
+    episodes: the applied forces of the Force environments are written again after every
+    reset. The force schedules of the sub-environments, see
+    `ModifiedParamsWrapper.set_force_schedule`, are applied too.
+
+    Sub-environments are reset on the step following the end of their episode (next-step
+    autoreset), with a reward of 0. The infos returned are empty.
+
+    With `n_threads > 1`, a pool of threads steps disjoint slices of the sub-environments in
+    parallel, writing directly into the shared preallocated arrays. MuJoCo releases the GIL
+    while simulating, so the threads run the physics concurrently within one process, without
+    the memory and inter-process communication costs of one process per environment.
+
+    Args:
+        env_cls (type[ModifiedParamsWrapper]): The Robust or Force environment class.
+        num_envs (int): The number of sub-environments.
+        params (np.ndarray, optional): The initial parameters, of shape
+            `(num_envs, n_params)`. Defaults to the parameters of a new environment.
+        copy (bool): If True, `reset` and `step` return copies of the observations, rewards,
+            terminations and truncations. Otherwise they return the preallocated arrays,
+            which are overwritten by the next call.
+        n_threads (int): The number of threads stepping the sub-environments, 1 (default)
+            stepping them sequentially in the calling thread.
+        **kwargs: Keyword arguments passed to `env_cls`, the sub-environments being made
+            with the fast construction path (`fast=True`) unless `fast=False` is given.
+    """
+
+    def __init__(
+        self,
+        env_cls: type[ModifiedParamsWrapper],
+        num_envs: int,
+        params: np.ndarray | None = None,
+        copy: bool = False,
+        n_threads: int = 1,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        self.env_cls = env_cls
+        self.num_envs = num_envs
+        self.copy = copy
+        kwargs.setdefault("fast", True)
+        self.envs = [env_cls(**kwargs) for _ in range(num_envs)]
+        self.param_names = env_cls.param_names
+
+        self._params = np.stack([env.get_params_array() for env in self.envs])
+        for env, row in zip(self.envs, self._params):
+            # The parameters of each env are a view on its row of the matrix
+            env._params = row
+        if params is not None:
+            self.set_params_array(params)
+
+        env = self.envs[0]
+        self.metadata = dict(env.metadata)
+        if AutoresetMode is not None:
+            self.metadata["autoreset_mode"] = AutoresetMode.NEXT_STEP
+        self.render_mode = env.render_mode
+        self.single_action_space = env.action_space
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self.single_observation_space = env.observation_space
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        time_limit = env._time_limit()
+        self.max_episode_steps = (
+            None if time_limit is None else time_limit._max_episode_steps
+        )
+
+        self._unwrapped = [env.unwrapped for env in self.envs]
+        self._observations = create_empty_array(
+            self.single_observation_space, n=num_envs, fn=np.zeros
+        )
+        self._rewards = np.zeros(num_envs, dtype=np.float64)
+        self._terminations = np.zeros(num_envs, dtype=np.bool_)
+        self._truncations = np.zeros(num_envs, dtype=np.bool_)
+        self._autoreset_envs = np.zeros(num_envs, dtype=np.bool_)
+        self._elapsed_steps = np.zeros(num_envs, dtype=np.int64)
+
+        self.n_threads = min(n_threads, num_envs)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=self.n_threads)
+            if self.n_threads > 1
+            else None
+        )
+        bounds = np.linspace(0, num_envs, self.n_threads + 1).astype(int)
+        self._slices = [
+            range(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def set_params_array(self, params: np.ndarray):
+        """
+        Sets the parameters of every sub-environment with one batched copy into the
+        parameters matrix, then writes the changed ones to the model of each
+        sub-environment in a loop over the sub-environments.
+
+        Args:
+            params (np.ndarray): The parameters, of shape `(num_envs, n_params)` and ordered
+                as `param_names`, NaN leaving the parameter unset.
+        """
+        np.copyto(self._params, params)
+        for env in self.envs:
+            env._change_params()
+
+    def get_params_array(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns the parameters of the sub-environments.
+
+        Args:
+            out (np.ndarray, optional): Preallocated float64 array of shape
+                `(num_envs, n_params)` the parameters are copied into.
+
+        Returns:
+            np.ndarray: `out`, or a new array if `out` is None.
+        """
+        if out is None:
+            return self._params.copy()
+        np.copyto(out, self._params)
+        return out
+
+    def _reset_env(self, i: int, seed: int | None = None) -> Any:
+        obs, _ = self._unwrapped[i].reset(seed=seed)
+        env = self.envs[i]
+        env._bound_binding().invalidate("data")
+        env._change_params()
+        env._schedule_step = 0
+        self._elapsed_steps[i] = 0
+        return obs
+
+    def _reset_slice(self, indices: range, seeds: list[int | None]):
+        for i in indices:
+            self._observations[i] = self._reset_env(i, seeds[i])
+
+    def _step_slice(self, indices: range, actions: np.ndarray):
+        for i in indices:
+            if self._autoreset_envs[i]:
+                self._observations[i] = self._reset_env(i)
+                self._rewards[i] = 0.0
+                self._terminations[i] = False
+                self._truncations[i] = False
+            else:
+                if self.envs[i]._force_schedule is not None:
+                    self.envs[i]._apply_force_schedule()
+                obs, reward, terminated, truncated, _ = self._unwrapped[i].step(
+                    actions[i]
+                )
+                self._elapsed_steps[i] += 1
+                self._observations[i] = obs
+                self._rewards[i] = reward
+                self._terminations[i] = terminated
+                self._truncations[i] = truncated
+
+    def _run(self, fn: Any, *args: Any):
+        # Runs `fn(indices, *args)` on every slice of the sub-environments
+        if self._executor is None:
+            fn(range(self.num_envs), *args)
+            return
+        futures = [
+            self._executor.submit(fn, indices, *args) for indices in self._slices
+        ]
+        for future in futures:
+            future.result()
+
+    def _outputs(self) -> tuple[Any, ...]:
+        outputs = (
+            self._observations,
+            self._rewards,
+            self._terminations,
+            self._truncations,
+        )
+        if self.copy:
+            return tuple(np.copy(output) for output in outputs)
+        return outputs
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Resets every sub-environment.
+
+        Args:
+            seed (int | list[int | None], optional): The seed of each sub-environment, an
+                int `seed` seeding them with `seed, seed + 1, ...`.
+            options (dict, optional): `{"params": params}` sets the parameters of the
+                sub-environments before the reset, see `set_params_array`.
+
+        Returns:
+            tuple: The observations, of shape `(num_envs, ...)`, and empty infos.
+        """
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} seeds, got {len(seeds)}")
+        if options is not None and "params" in options:
+            np.copyto(self._params, options["params"])
+
+        self._run(self._reset_slice, seeds)
+        self._autoreset_envs.fill(False)
+        return self._outputs()[0], {}
+
+    def step(self, actions: np.ndarray) -> tuple[Any, ...]:
+        """
+        Steps every sub-environment, resetting those whose episode ended at the previous step.
+
+        Args:
+            actions (np.ndarray): The actions, of shape `(num_envs, ...)`.
+
+        Returns:
+            tuple: The observations, rewards, terminations and truncations, of shape
+                `(num_envs, ...)`, and empty infos.
+        """
+        self._run(self._step_slice, actions)
+        if self.max_episode_steps is not None:
+            self._truncations |= self._elapsed_steps >= self.max_episode_steps
+        np.logical_or(self._terminations, self._truncations, out=self._autoreset_envs)
+        return *self._outputs(), {}
+
+    def close_extras(self, **kwargs: Any):
+        if self._executor is not None:
+            self._executor.shutdown()
+        for env in self.envs:
+            env.close()
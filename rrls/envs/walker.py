@@ -3,8 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-import gymnasium as gym
-from gymnasium import Wrapper
+from ._base import ModifiedParamsWrapper, ParamsBinding, make_mujoco_env
 
 DEFAULT_PARAMS = {
     "worldfriction": 0.7,
@@ -39,7 +38,7 @@ class Walker2dParamsBound(Enum):
     }
 
 
-class RobustWalker2d(Wrapper):
+class RobustWalker2d(ModifiedParamsWrapper):
     """
     Robust Walker2d environment. You can change the parameters of the environment using options in
     the reset method or by using the set_params method. The parameters are changed by calling
@@ -62,6 +61,20 @@ class RobustWalker2d(Wrapper):
         ],
     }
 
+    _binding = ParamsBinding(
+        {
+            "worldfriction": ("model.geom_friction", ("floor", 0)),
+            "torsomass": ("model.body_mass", "torso"),
+            "thighmass": ("model.body_mass", "thigh"),
+            "legmass": ("model.body_mass", "leg"),
+            "footmass": ("model.body_mass", "foot"),
+            "leftthighmass": ("model.body_mass", "thigh_left"),
+            "leftlegmass": ("model.body_mass", "leg_left"),
+            "leftfootmass": ("model.body_mass", "foot_left"),
+        }
+    )
+    _default_params = DEFAULT_PARAMS
+
     def __init__(
         self,
         worldfriction: float | None = None,
@@ -72,9 +85,14 @@ class RobustWalker2d(Wrapper):
         leftthighmass: float | None = None,
         leftlegmass: float | None = None,
         leftfootmass: float | None = None,
+        info_params: str = "step",
+        fast: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(env=gym.make("Walker2d-v5", **kwargs))  # type: ignore
+        super().__init__(
+            env=make_mujoco_env("Walker2d-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params(
             worldfriction=worldfriction,
             torsomass=torsomass,
@@ -152,45 +170,8 @@ class RobustWalker2d(Wrapper):
             "leftfootmass": self.leftfootmass,
         }
 
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
-
-    def _change_params(self):
-        if self.worldfriction is not None:
-            self.unwrapped.model.geom_friction[0, 0] = self.worldfriction  # type: ignore
-
-        if self.torsomass is not None:
-            self.unwrapped.model.body_mass[1] = self.torsomass  # type: ignore
-
-        if self.thighmass is not None:
-            self.unwrapped.model.body_mass[2] = self.thighmass  # type: ignore
-
-        if self.legmass is not None:
-            self.unwrapped.model.body_mass[3] = self.legmass  # type: ignore
-
-        if self.footmass is not None:
-            self.unwrapped.model.body_mass[4] = self.footmass  # type: ignore
-
-        if self.leftthighmass is not None:
-            self.unwrapped.model.body_mass[5] = self.leftthighmass  # type: ignore
-
-        if self.leftlegmass is not None:
-            self.unwrapped.model.body_mass[6] = self.leftlegmass  # type: ignore
 
-        if self.leftfootmass is not None:
-            self.unwrapped.model.body_mass[7] = self.leftfootmass  # type: ignore
-
-
-class ForceWalker2d(Wrapper):
+class ForceWalker2d(ModifiedParamsWrapper):
     """
     Force Walker2d environment. You can apply forces to the environment using the set_params method.
     The parameters are changed by calling the change_params method. The parameters are:
@@ -225,8 +206,39 @@ class ForceWalker2d(Wrapper):
         ],
     }
 
-    def __init__(self, **kwargs: dict[str, Any]):
-        super().__init__(env=gym.make("Walker2d-v5", **kwargs))  # type: ignore
+    _binding = ParamsBinding(
+        {
+            "torsoforce_x": ("data.xfrc_applied", ("torso", 0)),
+            "torsoforce_y": ("data.xfrc_applied", ("torso", 1)),
+            "torsoforce_z": ("data.xfrc_applied", ("torso", 2)),
+            "thighforce_x": ("data.xfrc_applied", ("thigh", 0)),
+            "thighforce_y": ("data.xfrc_applied", ("thigh", 1)),
+            "thighforce_z": ("data.xfrc_applied", ("thigh", 2)),
+            "legforce_x": ("data.xfrc_applied", ("leg", 0)),
+            "legforce_y": ("data.xfrc_applied", ("leg", 1)),
+            "legforce_z": ("data.xfrc_applied", ("leg", 2)),
+            "footforce_x": ("data.xfrc_applied", ("foot", 0)),
+            "footforce_y": ("data.xfrc_applied", ("foot", 1)),
+            "footforce_z": ("data.xfrc_applied", ("foot", 2)),
+            "leftthighforce_x": ("data.xfrc_applied", ("thigh_left", 0)),
+            "leftthighforce_y": ("data.xfrc_applied", ("thigh_left", 1)),
+            "leftthighforce_z": ("data.xfrc_applied", ("thigh_left", 2)),
+            "leftlegforce_x": ("data.xfrc_applied", ("leg_left", 0)),
+            "leftlegforce_y": ("data.xfrc_applied", ("leg_left", 1)),
+            "leftlegforce_z": ("data.xfrc_applied", ("leg_left", 2)),
+            "leftfootforce_x": ("data.xfrc_applied", ("foot_left", 0)),
+            "leftfootforce_y": ("data.xfrc_applied", ("foot_left", 1)),
+            "leftfootforce_z": ("data.xfrc_applied", ("foot_left", 2)),
+        }
+    )
+
+    def __init__(
+        self, info_params: str = "step", fast: bool = False, **kwargs: dict[str, Any]
+    ):
+        super().__init__(
+            env=make_mujoco_env("Walker2d-v5", fast=fast, **kwargs),
+            info_params=info_params,
+        )
         self.set_params()
 
     def set_params(
@@ -300,79 +312,3 @@ class ForceWalker2d(Wrapper):
             "leftfootforce_y": self.leftfootforce_y,
             "leftfootforce_z": self.leftfootforce_z,
         }
-
-    def _change_params(self):
-        if self.torsoforce_x is not None:
-            self.unwrapped.data.xfrc_applied[1, 0] = self.torsoforce_x  # type: ignore
-
-        if self.torsoforce_y is not None:
-            self.unwrapped.data.xfrc_applied[1, 1] = self.torsoforce_y  # type: ignore
-
-        if self.torsoforce_z is not None:
-            self.unwrapped.data.xfrc_applied[1, 2] = self.torsoforce_z  # type: ignore
-
-        if self.thighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[2, 0] = self.thighforce_x  # type: ignore
-
-        if self.thighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[2, 1] = self.thighforce_y  # type: ignore
-
-        if self.thighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[2, 2] = self.thighforce_z  # type: ignore
-
-        if self.legforce_x is not None:
-            self.unwrapped.data.xfrc_applied[3, 0] = self.legforce_x  # type: ignore
-
-        if self.legforce_y is not None:
-            self.unwrapped.data.xfrc_applied[3, 1] = self.legforce_y  # type: ignore
-
-        if self.legforce_z is not None:
-            self.unwrapped.data.xfrc_applied[3, 2] = self.legforce_z  # type: ignore
-
-        if self.footforce_x is not None:
-            self.unwrapped.data.xfrc_applied[4, 0] = self.footforce_x  # type: ignore
-
-        if self.footforce_y is not None:
-            self.unwrapped.data.xfrc_applied[4, 1] = self.footforce_y  # type: ignore
-
-        if self.footforce_z is not None:
-            self.unwrapped.data.xfrc_applied[4, 2] = self.footforce_z  # type: ignore
-
-        if self.leftthighforce_x is not None:
-            self.unwrapped.data.xfrc_applied[5, 0] = self.leftthighforce_x  # type: ignore
-
-        if self.leftthighforce_y is not None:
-            self.unwrapped.data.xfrc_applied[5, 1] = self.leftthighforce_y  # type: ignore
-
-        if self.leftthighforce_z is not None:
-            self.unwrapped.data.xfrc_applied[5, 2] = self.leftthighforce_z  # type: ignore
-
-        if self.leftlegforce_x is not None:
-            self.unwrapped.data.xfrc_applied[6, 0] = self.leftlegforce_x  # type: ignore
-
-        if self.leftlegforce_y is not None:
-            self.unwrapped.data.xfrc_applied[6, 1] = self.leftlegforce_y  # type: ignore
-
-        if self.leftlegforce_z is not None:
-            self.unwrapped.data.xfrc_applied[6, 2] = self.leftlegforce_z  # type: ignore
-
-        if self.leftfootforce_x is not None:
-            self.unwrapped.data.xfrc_applied[7, 0] = self.leftfootforce_x  # type: ignore
-
-        if self.leftfootforce_y is not None:
-            self.unwrapped.data.xfrc_applied[7, 1] = self.leftfootforce_y  # type: ignore
-
-        if self.leftfootforce_z is not None:
-            self.unwrapped.data.xfrc_applied[7, 2] = self.leftfootforce_z  # type: ignore
-
-    def reset(self, *, seed: int | None = None, options: dict | None = None):
-        if options is not None:
-            self.set_params(**options)
-        obs, info = self.env.reset(seed=seed, options=options)
-        info.update(self.get_params())
-        return obs, info
-
-    def step(self, action):
-        obs, reward, terminated, truncated, info = self.env.step(action)
-        info.update(self.get_params())
-        return obs, reward, terminated, truncated, info
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import itertools
-from typing import Annotated, Callable
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.context import BaseContext
+from typing import Annotated, Callable, overload
 
 import numpy as np
 
@@ -22,6 +31,41 @@ from .envs import (
 )
 
 
+def _mesh_parameters_values(
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    nb_mesh_dim: int,
+) -> dict[str, list[float]]:
+    return {
+        parameter_name: np.arange(
+            start=bound_value[0],
+            stop=bound_value[1],  # type: ignore
+            step=(bound_value[1] - bound_value[0]) / nb_mesh_dim,  # type: ignore
+        ).tolist()
+        for parameter_name, bound_value in param_bounds.items()
+    }
+
+
+def mesh_points(
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    nb_mesh_dim: int = 10,
+) -> np.ndarray:
+    """
+    Mesh the parameter space the same way as `generate_evaluation_set`.
+
+    Args:
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_mesh_dim (int): Number of mesh dimensions.
+
+    Returns:
+        np.ndarray: The mesh points, of shape `(nb_points, len(param_bounds))`.
+    """
+    parameters_values = _mesh_parameters_values(param_bounds, nb_mesh_dim)
+    points = np.array(
+        list(itertools.product(*parameters_values.values())), dtype=np.float64
+    )
+    return points.reshape(-1, len(param_bounds))
+
+
 def generate_evaluation_set(
     modified_env: Callable[[], ModifiedParamsEnv],
     param_bounds: dict[str, Annotated[list[float], 2]],
@@ -40,14 +84,7 @@ def generate_evaluation_set(
     """
     # Generate all combinations of environments given the mesh
     eval_envs = []
-    parameters_values = {
-        parameter_name: np.arange(
-            start=bound_value[0],
-            stop=bound_value[1],  # type: ignore
-            step=(bound_value[1] - bound_value[0]) / nb_mesh_dim,  # type: ignore
-        ).tolist()
-        for parameter_name, bound_value in param_bounds.items()
-    }
+    parameters_values = _mesh_parameters_values(param_bounds, nb_mesh_dim)
     for values in itertools.product(*parameters_values.values()):
         params = dict(zip(parameters_values.keys(), values))
         env = modified_env(**params)
@@ -56,102 +93,1304 @@ def generate_evaluation_set(
     return eval_envs
 
 
-EVALUATION_ROBUST_ANT_1D = generate_evaluation_set(
+class _LazyEvaluationSet(Sequence, ABC):
+    # Builds the environments of an evaluation set on demand from the parameters of its points,
+    # subclasses define the points through `__len__`, `params`, `iter_params` and `points`.
+
+    modified_env: Callable[[], ModifiedParamsEnv]
+    param_bounds: dict[str, Annotated[list[float], 2]]
+
+    @abstractmethod
+    def params(self, index: int) -> dict[str, float]: ...
+
+    @abstractmethod
+    def iter_params(self) -> Iterator[dict[str, float]]: ...
+
+    @abstractmethod
+    def points(self) -> np.ndarray: ...
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"evaluation set index out of range: {index}")
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> ModifiedParamsEnv: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ModifiedParamsEnv]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.modified_env(**self.params(index))
+
+    def __iter__(self) -> Iterator[ModifiedParamsEnv]:
+        for params in self.iter_params():
+            yield self.modified_env(**params)
+
+    @property
+    def _modified_env_name(self) -> str:
+        return getattr(self.modified_env, "__name__", repr(self.modified_env))
+
+
+class EvaluationSet(_LazyEvaluationSet):
+    """
+    A lazy evaluation set. Only the mesh specification is stored, each environment is built
+    on demand when the set is indexed or iterated. The environments are yielded in the same
+    order as the list returned by `generate_evaluation_set`.
+
+    Args:
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_mesh_dim (int): Number of mesh dimensions.
+    """
+
+    def __init__(
+        self,
+        modified_env: Callable[[], ModifiedParamsEnv],
+        param_bounds: dict[str, Annotated[list[float], 2]],
+        nb_mesh_dim: int = 10,
+    ):
+        self.modified_env = modified_env
+        self.param_bounds = param_bounds
+        self.nb_mesh_dim = nb_mesh_dim
+        self._parameters_values: dict[str, list[float]] | None = None
+
+    @property
+    def parameters_values(self) -> dict[str, list[float]]:
+        """The mesh values of each parameter, computed on first access."""
+        if self._parameters_values is None:
+            self._parameters_values = _mesh_parameters_values(
+                self.param_bounds, self.nb_mesh_dim
+            )
+        return self._parameters_values
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(values) for values in self.parameters_values.values())
+
+    def __len__(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def params(self, index: int) -> dict[str, float]:
+        """
+        Returns the parameters of the environment at the given index of the mesh.
+
+        Args:
+            index (int): Index of the mesh point.
+
+        Returns:
+            dict[str, float]: The parameters of the mesh point.
+        """
+        multi_index = np.unravel_index(self._check_index(index), self.shape)
+        return {
+            name: values[i]
+            for (name, values), i in zip(self.parameters_values.items(), multi_index)
+        }
+
+    def iter_params(self) -> Iterator[dict[str, float]]:
+        """Iterates over the parameters of every mesh point without building any environment."""
+        names = list(self.parameters_values.keys())
+        for values in itertools.product(*self.parameters_values.values()):
+            yield dict(zip(names, values))
+
+    def points(self) -> np.ndarray:
+        """
+        Returns every mesh point as an array of shape `(len(self), len(self.param_bounds))`,
+        with columns ordered as `self.param_bounds`.
+        """
+        return mesh_points(self.param_bounds, self.nb_mesh_dim)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(modified_env={self._modified_env_name}, "
+            f"param_bounds={self.param_bounds}, nb_mesh_dim={self.nb_mesh_dim})"
+        )
+
+
+def _first_primes(nb_primes: int) -> list[int]:
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < nb_primes:
+        if all(candidate % prime for prime in primes if prime * prime <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _halton(nb_points: int, dim: int, rng: np.random.Generator | None) -> np.ndarray:
+    samples = np.zeros((nb_points, dim))
+    for axis, base in enumerate(_first_primes(dim)):
+        # Radical inverse of 1..nb_points in `base`, skipping the origin
+        indices = np.arange(1, nb_points + 1)
+        fraction = 1.0
+        while np.any(indices > 0):
+            fraction /= base
+            samples[:, axis] += fraction * (indices % base)
+            indices //= base
+    if rng is not None:
+        # Random shift modulo 1, keeps the low discrepancy of the sequence
+        samples = (samples + rng.random(dim)) % 1.0
+    return samples
+
+
+def _latin_hypercube(nb_points: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    strata = np.stack([rng.permutation(nb_points) for _ in range(dim)], axis=1)
+    return (strata + rng.random((nb_points, dim))) / nb_points
+
+
+def quasi_random_points(
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    nb_points: int,
+    method: str = "halton",
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Sample the parameter space with a low-discrepancy design of a fixed number of points,
+    whatever the number of parameters, as an alternative to `mesh_points`.
+
+    Args:
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_points (int): Number of points.
+        method (str): "halton", "sobol" (requires scipy) or "lhs" for a Latin hypercube.
+        seed (int, optional): Seed of the randomization. The Halton sequence is only shifted
+            and the Sobol sequence only scrambled when a seed is given.
+
+    Returns:
+        np.ndarray: The points, of shape `(nb_points, len(param_bounds))`.
+    """
+    dim = len(param_bounds)
+    if method == "halton":
+        rng = None if seed is None else np.random.default_rng(seed)
+        samples = _halton(nb_points, dim, rng)
+    elif method == "lhs":
+        samples = _latin_hypercube(nb_points, dim, np.random.default_rng(seed))
+    elif method == "sobol":
+        try:
+            from scipy.stats import qmc
+        except ImportError as e:
+            raise ImportError(
+                'The "sobol" method requires scipy, install it with `pip install scipy`.'
+            ) from e
+        sampler = qmc.Sobol(d=dim, scramble=seed is not None, seed=seed)
+        samples = sampler.random(nb_points)
+    else:
+        raise ValueError(
+            f'Unknown method "{method}", expected "halton", "sobol" or "lhs".'
+        )
+
+    low = np.array([bound[0] for bound in param_bounds.values()], dtype=np.float64)
+    high = np.array([bound[1] for bound in param_bounds.values()], dtype=np.float64)
+    return low + samples * (high - low)
+
+
+class QuasiRandomEvaluationSet(_LazyEvaluationSet):
+    """
+    A lazy evaluation set of `nb_points` points drawn with `quasi_random_points`. Its cost is
+    fixed by `nb_points` instead of growing exponentially with the number of parameters like
+    `EvaluationSet`. Only the points are stored, each environment is built on demand when the
+    set is indexed or iterated.
+
+    Args:
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_points (int): Number of points.
+        method (str): "halton", "sobol" (requires scipy) or "lhs" for a Latin hypercube.
+        seed (int, optional): Seed of the randomization of the design.
+    """
+
+    def __init__(
+        self,
+        modified_env: Callable[[], ModifiedParamsEnv],
+        param_bounds: dict[str, Annotated[list[float], 2]],
+        nb_points: int = 1000,
+        method: str = "halton",
+        seed: int | None = None,
+    ):
+        self.modified_env = modified_env
+        self.param_bounds = param_bounds
+        self.nb_points = nb_points
+        self.method = method
+        self.seed = seed
+        self._points: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.nb_points
+
+    def points(self) -> np.ndarray:
+        """
+        Returns every point as an array of shape `(len(self), len(self.param_bounds))`,
+        with columns ordered as `self.param_bounds`.
+        """
+        if self._points is None:
+            self._points = quasi_random_points(
+                self.param_bounds, self.nb_points, method=self.method, seed=self.seed
+            )
+        return self._points
+
+    def params(self, index: int) -> dict[str, float]:
+        """
+        Returns the parameters of the environment at the given index.
+
+        Args:
+            index (int): Index of the point.
+
+        Returns:
+            dict[str, float]: The parameters of the point.
+        """
+        point = self.points()[self._check_index(index)]
+        return dict(zip(self.param_bounds.keys(), point.tolist()))
+
+    def iter_params(self) -> Iterator[dict[str, float]]:
+        """Iterates over the parameters of every point without building any environment."""
+        for point in self.points():
+            yield dict(zip(self.param_bounds.keys(), point.tolist()))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(modified_env={self._modified_env_name}, "
+            f"param_bounds={self.param_bounds}, nb_points={self.nb_points}, "
+            f"method={self.method!r}, seed={self.seed})"
+        )
+
+
+Policy = Callable[[np.ndarray], np.ndarray]
+
+_RESULTS_FIELDS = [("return", np.float64), ("length", np.int64), ("seed", np.int64)]
+
+
+def results_dtype(param_names: Sequence[str]) -> np.dtype:
+    """
+    The dtype of the structured arrays returned by the evaluators: one field per parameter,
+    followed by the episode `return`, its `length` and the `seed` used to reset the environment
+    (-1 when the environment was reset without a seed).
+    """
+    return np.dtype([(name, np.float64) for name in param_names] + _RESULTS_FIELDS)
+
+
+def point_seed(seed: int | None, index: int) -> int | None:
+    """
+    The seed used to reset the environment for the point at `index`, so that a point is
+    always evaluated with the same seed whatever the order of evaluation.
+    """
+    return None if seed is None else seed + index
+
+
+def rollout(
+    policy: Policy,
+    env: ModifiedParamsEnv,
+    params: dict[str, float],
+    seed: int | None = None,
+) -> tuple[float, int]:
+    """
+    Runs one episode of `policy` on `env` after reconfiguring it with `params`.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        env (ModifiedParamsEnv): The environment, reused across calls.
+        params (dict[str, float]): Parameters given to `env.reset` through `options`.
+        seed (int, optional): Seed for the environment reset.
+
+    Returns:
+        tuple[float, int]: The undiscounted return and the length of the episode.
+    """
+    obs, _ = env.reset(seed=seed, options=params)
+    episode_return, length = 0.0, 0
+    terminated, truncated = False, False
+    while not (terminated or truncated):
+        obs, reward, terminated, truncated, _ = env.step(policy(obs))
+        episode_return += float(reward)
+        length += 1
+    return episode_return, length
+
+
+def _evaluate_chunk(
+    policy: Policy,
+    pool: list[ModifiedParamsEnv],
+    param_names: Sequence[str],
+    points: np.ndarray,
+    indices: np.ndarray,
+    seed: int | None,
+) -> np.ndarray:
+    # `indices` are the indices of the points in the whole evaluation, they keep the
+    # per-point seeds independent of how the points are chunked.
+    results = np.zeros(len(points), dtype=results_dtype(param_names))
+    for offset, (index, point) in enumerate(zip(indices.tolist(), points)):
+        params = dict(zip(param_names, point.tolist()))
+        env_seed = point_seed(seed, index)
+        episode_return, length = rollout(
+            policy, pool[index % len(pool)], params, seed=env_seed
+        )
+        results[offset] = (
+            *point,
+            episode_return,
+            length,
+            -1 if env_seed is None else env_seed,
+        )
+    return results
+
+
+# State of a worker process of `PointEvaluator`, built once by `_init_worker`
+_worker_policy: Policy | None = None
+_worker_pool: list[ModifiedParamsEnv] = []
+
+
+def _init_worker(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    pool_size: int,
+):
+    global _worker_policy, _worker_pool
+    _worker_policy = policy
+    _worker_pool = [modified_env() for _ in range(pool_size)]
+
+
+def _evaluate_chunk_in_worker(
+    param_names: Sequence[str],
+    points: np.ndarray,
+    indices: np.ndarray,
+    seed: int | None,
+) -> np.ndarray:
+    return _evaluate_chunk(
+        _worker_policy, _worker_pool, param_names, points, indices, seed  # type: ignore
+    )
+
+
+class PointEvaluator:
+    """
+    Evaluates `policy` for one episode on parameter points. Instead of building one environment
+    per point, a pool of environments is built once and reconfigured through `set_params`
+    for each point, so memory stays O(pool_size). The environments of a pool are used in
+    turn, never concurrently, and the current process only builds one. The pool is kept between calls
+    to `evaluate` and released by `close`, the evaluator can be used as a context manager.
+
+    With `n_workers > 1` the points are split in chunks evaluated by a pool of processes,
+    each owning its own pool of environments. Since the seed of a point only depends on its
+    index and the results are merged in order, the output does not depend on `n_workers`
+    for deterministic policies. `policy` and `modified_env` must then be picklable.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_names (Sequence[str]): Name of the parameter of each column of the points.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        chunk_size (int, optional): Number of points sent at once to a worker.
+            Defaults to splitting the points in 4 chunks per worker.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        modified_env: Callable[[], ModifiedParamsEnv],
+        param_names: Sequence[str],
+        pool_size: int = 1,
+        n_workers: int = 1,
+        chunk_size: int | None = None,
+        mp_context: BaseContext | None = None,
+    ):
+        self.policy = policy
+        self.modified_env = modified_env
+        self.param_names = list(param_names)
+        # The current process evaluates the points one after the other with one environment
+        self.pool_size = pool_size if n_workers > 1 else 1
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context
+        self._pool: list[ModifiedParamsEnv] = []
+        self._executor: ProcessPoolExecutor | None = None
+
+    def evaluate(
+        self,
+        points: np.ndarray,
+        seed: int | None = None,
+        indices: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate the policy on every point.
+
+        Args:
+            points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+            seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+            indices (np.ndarray, optional): Index of each point, used to derive its seed.
+                Defaults to `range(nb_points)`.
+
+        Returns:
+            np.ndarray: A structured array of dtype `results_dtype(param_names)`, one entry per point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, len(self.param_names))
+        if len(points) == 0:
+            return np.zeros(0, dtype=results_dtype(self.param_names))
+        indices = np.arange(len(points)) if indices is None else np.asarray(indices)
+
+        if self.n_workers <= 1:
+            return _evaluate_chunk(
+                self.policy, self._get_pool(), self.param_names, points, indices, seed
+            )
+
+        chunk_size = self.chunk_size or -(-len(points) // (4 * self.n_workers))
+        starts = range(0, len(points), chunk_size)
+        chunks = self._get_executor().map(
+            _evaluate_chunk_in_worker,
+            itertools.repeat(self.param_names),
+            (points[start : start + chunk_size] for start in starts),
+            (indices[start : start + chunk_size] for start in starts),
+            itertools.repeat(seed),
+        )
+        return np.concatenate(list(chunks))
+
+    def iter_evaluate(
+        self,
+        points: np.ndarray,
+        seed: int | None = None,
+        indices: np.ndarray | None = None,
+    ) -> Iterator[tuple[int, np.void]]:
+        """
+        Evaluate the policy on every point, yielding each result as soon as it is available.
+        With worker processes, results come in order of completion and the points are sent
+        in chunks of `chunk_size`, one point by default. Closing the generator cancels the
+        chunks not started yet.
+
+        Args:
+            points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+            seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+            indices (np.ndarray, optional): Index of each point, used to derive its seed.
+                Defaults to `range(nb_points)`.
+
+        Yields:
+            tuple[int, np.void]: The index of the point and its result, a record of dtype
+                `results_dtype(param_names)`.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, len(self.param_names))
+        indices = np.arange(len(points)) if indices is None else np.asarray(indices)
+
+        if self.n_workers <= 1:
+            for index, point in zip(indices, points):
+                result = _evaluate_chunk(
+                    self.policy,
+                    self._get_pool(),
+                    self.param_names,
+                    point[None],
+                    index[None],
+                    seed,
+                )
+                yield int(index), result[0]
+            return
+
+        chunk_size = self.chunk_size or 1
+        executor = self._get_executor()
+        futures = {
+            executor.submit(
+                _evaluate_chunk_in_worker,
+                self.param_names,
+                points[start : start + chunk_size],
+                indices[start : start + chunk_size],
+                seed,
+            ): indices[start : start + chunk_size]
+            for start in range(0, len(points), chunk_size)
+        }
+        try:
+            for future in as_completed(futures):
+                for index, result in zip(futures[future], future.result()):
+                    yield int(index), result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_pool(self) -> list[ModifiedParamsEnv]:
+        if not self._pool:
+            self._pool = [self.modified_env() for _ in range(self.pool_size)]
+        return self._pool
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(self.policy, self.modified_env, self.pool_size),
+            )
+        return self._executor
+
+    def close(self):
+        for env in self._pool:
+            env.close()
+        self._pool = []
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> PointEvaluator:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def evaluate_points(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_names: Sequence[str],
+    points: np.ndarray,
+    pool_size: int = 1,
+    seed: int | None = None,
+    n_workers: int = 1,
+    chunk_size: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> np.ndarray:
+    """
+    Evaluate `policy` for one episode on every parameter point with a `PointEvaluator`
+    whose environments are released once done.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_names (Sequence[str]): Name of the parameter of each column of `points`.
+        points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        chunk_size (int, optional): Number of points sent at once to a worker.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_names)`, one entry per point.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, len(param_names))
+    with PointEvaluator(
+        policy,
+        modified_env,
+        param_names,
+        pool_size=max(1, min(pool_size, len(points))),
+        n_workers=n_workers,
+        chunk_size=chunk_size,
+        mp_context=mp_context,
+    ) as evaluator:
+        return evaluator.evaluate(points, seed=seed)
+
+
+def evaluate_points_lockstep(
+    batch_policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_names: Sequence[str],
+    points: np.ndarray,
+    nb_envs: int = 16,
+    seed: int | None = None,
+) -> np.ndarray:
+    """
+    Evaluate a batched policy for one episode on every parameter point by stepping `nb_envs`
+    environments in lockstep. At each step the observations of all the environments are
+    stacked in one contiguous `(nb_envs, *obs_shape)` array and `batch_policy` is called once.
+    Environments whose episode is over are reset with the next point, and masked out once
+    every point has been assigned.
+
+    Results and seeds are the same as `evaluate_points` with a policy applying
+    `batch_policy` to a single observation.
+
+    Args:
+        batch_policy (Policy): A function mapping a batch of observations `(nb_envs, *obs_shape)`
+            to a batch of actions `(nb_envs, *action_shape)`. Rows of finished environments
+            hold their last observation and their action is ignored.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_names (Sequence[str]): Name of the parameter of each column of `points`.
+        points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+        nb_envs (int): Number of environments stepped in lockstep.
+        seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_names)`, one entry per point.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, len(param_names))
+    results = np.zeros(len(points), dtype=results_dtype(param_names))
+    if len(points) == 0:
+        return results
+
+    envs = [modified_env() for _ in range(min(nb_envs, len(points)))]
+    observation_space = envs[0].observation_space
+    observations = np.zeros(
+        (len(envs), *observation_space.shape),  # type: ignore
+        dtype=observation_space.dtype,  # type: ignore
+    )
+    point_indices = np.full(len(envs), -1, dtype=np.int64)
+    returns = np.zeros(len(envs), dtype=np.float64)
+    lengths = np.zeros(len(envs), dtype=np.int64)
+    active = np.zeros(len(envs), dtype=bool)
+    next_index = 0
+
+    def start_episode(slot: int):
+        nonlocal next_index
+        if next_index >= len(points):
+            active[slot] = False
+            return
+        index, next_index = next_index, next_index + 1
+        params = dict(zip(param_names, points[index].tolist()))
+        observations[slot], _ = envs[slot].reset(
+            seed=point_seed(seed, index), options=params
+        )
+        point_indices[slot], returns[slot], lengths[slot] = index, 0.0, 0
+        active[slot] = True
+
+    try:
+        for slot in range(len(envs)):
+            start_episode(slot)
+        while active.any():
+            actions = batch_policy(observations)
+            for slot in np.flatnonzero(active):
+                obs, reward, terminated, truncated, _ = envs[slot].step(actions[slot])
+                observations[slot] = obs
+                returns[slot] += float(reward)
+                lengths[slot] += 1
+                if terminated or truncated:
+                    index = point_indices[slot]
+                    env_seed = point_seed(seed, int(index))
+                    results[index] = (
+                        *points[index],
+                        returns[slot],
+                        lengths[slot],
+                        -1 if env_seed is None else env_seed,
+                    )
+                    start_episode(slot)
+    finally:
+        for env in envs:
+            env.close()
+    return results
+
+
+def policy_fingerprint(*parts: bytes | str | np.ndarray) -> str:
+    """
+    Hashes a policy checkpoint into the identifier used by `ResultsStore`, e.g. from the
+    bytes of the checkpoint file or from the arrays of its weights.
+
+    Args:
+        parts (bytes | str | np.ndarray): The content identifying the policy.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the parts.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        elif isinstance(part, np.ndarray):
+            digest.update(str((part.dtype, part.shape)).encode())
+            part = np.ascontiguousarray(part).tobytes()
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class ResultsStore:
+    """
+    An append-only SQLite store of evaluation results, keyed by policy fingerprint,
+    environment id, parameter point and seed. It lets `evaluate_points_cached` skip points
+    already evaluated after a restart, and allows re-scoring a policy with a new aggregate
+    metric without new rollouts.
+
+    Args:
+        path (str | os.PathLike): Path of the SQLite database, created if needed.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    policy TEXT NOT NULL,
+                    env_id TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    seed INTEGER NOT NULL,
+                    return REAL NOT NULL,
+                    length INTEGER NOT NULL,
+                    PRIMARY KEY (policy, env_id, params, seed)
+                )
+                """)
+
+    @staticmethod
+    def _params_key(param_names: Sequence[str], point: np.ndarray) -> str:
+        # JSON keeps the shortest repr of the floats, which round-trips exactly
+        return json.dumps(dict(zip(param_names, point.tolist())), sort_keys=True)
+
+    def get(
+        self,
+        policy_id: str,
+        env_id: str,
+        param_names: Sequence[str],
+        point: np.ndarray,
+        seed: int,
+    ) -> tuple[float, int] | None:
+        """
+        Returns the stored return and length of an episode, or None if it is not stored.
+        """
+        row = self._connection.execute(
+            "SELECT return, length FROM results "
+            "WHERE policy = ? AND env_id = ? AND params = ? AND seed = ?",
+            (policy_id, env_id, self._params_key(param_names, point), seed),
+        ).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def add(self, policy_id: str, env_id: str, results: np.ndarray):
+        """
+        Stores the results of an evaluator, results already stored are left unchanged.
+
+        Args:
+            policy_id (str): Fingerprint of the policy.
+            env_id (str): Identifier of the environment.
+            results (np.ndarray): A structured array of dtype `results_dtype(param_names)`.
+        """
+        param_names = results.dtype.names[: -len(_RESULTS_FIELDS)]
+        rows = [
+            (
+                policy_id,
+                env_id,
+                self._params_key(
+                    param_names, np.array([result[name] for name in param_names])
+                ),
+                int(result["seed"]),
+                float(result["return"]),
+                int(result["length"]),
+            )
+            for result in results
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def results(
+        self, policy_id: str, env_id: str, param_names: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Returns every stored result of a policy on an environment over `param_names`.
+
+        Returns:
+            np.ndarray: A structured array of dtype `results_dtype(param_names)`.
+        """
+        rows = self._connection.execute(
+            "SELECT params, seed, return, length FROM results "
+            "WHERE policy = ? AND env_id = ? ORDER BY rowid",
+            (policy_id, env_id),
+        ).fetchall()
+        entries = []
+        for params, seed, episode_return, length in rows:
+            params = json.loads(params)
+            if set(params) == set(param_names):
+                entries.append(
+                    (
+                        *(params[name] for name in param_names),
+                        episode_return,
+                        length,
+                        seed,
+                    )
+                )
+        return np.array(entries, dtype=results_dtype(param_names))
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> ResultsStore:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def evaluate_points_cached(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_names: Sequence[str],
+    points: np.ndarray,
+    store: ResultsStore,
+    policy_id: str,
+    env_id: str,
+    seed: int = 0,
+    flush_every: int = 64,
+    pool_size: int = 1,
+    n_workers: int = 1,
+    mp_context: BaseContext | None = None,
+) -> np.ndarray:
+    """
+    Same as `evaluate_points`, but the points already in `store` are not evaluated again and
+    new results are written to `store` every `flush_every` points, so an interrupted
+    evaluation resumes where it stopped. A seed is required since it is part of the key.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_names (Sequence[str]): Name of the parameter of each column of `points`.
+        points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+        store (ResultsStore): The results store.
+        policy_id (str): Fingerprint of the policy, see `policy_fingerprint`.
+        env_id (str): Identifier of the environment, e.g. its gymnasium id.
+        seed (int): Base seed, the point at index `i` is reset with `seed + i`.
+        flush_every (int): Number of points evaluated between two writes to `store`.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_names)`, one entry per point.
+    """
+    param_names = list(param_names)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, len(param_names))
+    results = np.zeros(len(points), dtype=results_dtype(param_names))
+    missing = []
+    for index, point in enumerate(points):
+        env_seed = point_seed(seed, index)
+        stored = store.get(policy_id, env_id, param_names, point, env_seed)  # type: ignore
+        if stored is None:
+            missing.append(index)
+        else:
+            results[index] = (*point, *stored, env_seed)
+
+    with PointEvaluator(
+        policy,
+        modified_env,
+        param_names,
+        pool_size=pool_size,
+        n_workers=n_workers,
+        mp_context=mp_context,
+    ) as evaluator:
+        for start in range(0, len(missing), flush_every):
+            indices = np.array(missing[start : start + flush_every])
+            batch = evaluator.evaluate(points[indices], seed=seed, indices=indices)
+            store.add(policy_id, env_id, batch)
+            results[indices] = batch
+    return results
+
+
+StopPredicate = Callable[[np.void], bool]
+
+
+def return_below(threshold: float) -> StopPredicate:
+    """
+    Stop predicate for `iter_evaluate_points`, true once an episode returns less than `threshold`.
+    """
+
+    def stop(result: np.void) -> bool:
+        return bool(result["return"] < threshold)
+
+    return stop
+
+
+def time_budget(seconds: float) -> StopPredicate:
+    """
+    Stop predicate for `iter_evaluate_points`, true once `seconds` have elapsed since its creation.
+    """
+    deadline = time.monotonic() + seconds
+
+    def stop(result: np.void) -> bool:
+        return time.monotonic() >= deadline
+
+    return stop
+
+
+def iter_evaluate_points(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_names: Sequence[str],
+    points: np.ndarray,
+    stop: StopPredicate | None = None,
+    pool_size: int = 1,
+    seed: int | None = None,
+    n_workers: int = 1,
+    chunk_size: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> Iterator[tuple[int, np.void]]:
+    """
+    Streaming version of `evaluate_points`: each result is yielded as soon as its episode is
+    over, and the evaluation stops after the first result for which `stop` is true. For
+    instance, a checkpoint can be rejected after a handful of episodes with
+    `stop=return_below(threshold)`.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_names (Sequence[str]): Name of the parameter of each column of `points`.
+        points (np.ndarray): Parameter points of shape `(nb_points, len(param_names))`.
+        stop (StopPredicate, optional): Called on each result, the evaluation stops once it returns True.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        chunk_size (int, optional): Number of points sent at once to a worker, defaults to 1.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Yields:
+        tuple[int, np.void]: The index of the point and its result, a record of dtype
+            `results_dtype(param_names)`. With worker processes, in order of completion.
+    """
+    with PointEvaluator(
+        policy,
+        modified_env,
+        param_names,
+        pool_size=pool_size,
+        n_workers=n_workers,
+        chunk_size=chunk_size,
+        mp_context=mp_context,
+    ) as evaluator:
+        for index, result in evaluator.iter_evaluate(points, seed=seed):
+            yield index, result
+            if stop is not None and stop(result):
+                return
+
+
+def evaluate_mesh(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    nb_mesh_dim: int = 10,
+    pool_size: int = 1,
+    seed: int | None = None,
+    n_workers: int = 1,
+    chunk_size: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> np.ndarray:
+    """
+    Evaluate `policy` on the same mesh as `generate_evaluation_set` while reusing a pool of
+    environments, see `evaluate_points`.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_mesh_dim (int): Number of mesh dimensions.
+        pool_size (int): Number of environments reused across the mesh by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        seed (int, optional): Base seed, the point at index `i` is reset with `seed + i`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        chunk_size (int, optional): Number of points sent at once to a worker.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_bounds)`, one entry per mesh point.
+    """
+    return evaluate_points(
+        policy,
+        modified_env,
+        list(param_bounds.keys()),
+        mesh_points(param_bounds, nb_mesh_dim),
+        pool_size=pool_size,
+        seed=seed,
+        n_workers=n_workers,
+        chunk_size=chunk_size,
+        mp_context=mp_context,
+    )
+
+
+def worst_case(results: np.ndarray) -> tuple[dict[str, float], float]:
+    """
+    Returns the parameters and the return of the worst episode of an evaluator's results.
+
+    Args:
+        results (np.ndarray): A structured array of dtype `results_dtype(param_names)`.
+
+    Returns:
+        tuple[dict[str, float], float]: The parameters of the worst point and its return.
+    """
+    worst = results[np.argmin(results["return"])]
+    param_names = results.dtype.names[: -len(_RESULTS_FIELDS)]
+    return {name: float(worst[name]) for name in param_names}, float(worst["return"])
+
+
+def _grid(low: np.ndarray, high: np.ndarray, nb_mesh_dim: int) -> np.ndarray:
+    # Unlike `mesh_points`, both bounds of each interval are part of the grid
+    axes = [np.linspace(lo, hi, nb_mesh_dim) for lo, hi in zip(low, high)]
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(low))
+
+
+def adaptive_worst_case_search(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    nb_mesh_dim: int = 3,
+    resolution: float = 0.01,
+    nb_refined_points: int = 1,
+    pool_size: int = 1,
+    seed: int | None = None,
+    n_workers: int = 1,
+    mp_context: BaseContext | None = None,
+) -> np.ndarray:
+    """
+    Search the worst-case parameters of `policy` with a coarse-to-fine mesh. A coarse grid of
+    `nb_mesh_dim` points per dimension is evaluated first, then the cells around the
+    `nb_refined_points` lowest returns found so far are meshed again with the same number of
+    points, until the spacing of the grid is below `resolution` times the width of each
+    interval. Points already evaluated are skipped.
+
+    With the defaults, each refinement halves the spacing of the grid, so reaching the
+    resolution of a 100 points per dimension mesh costs a few hundred episodes in 3D
+    instead of 10^6.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        nb_mesh_dim (int): Number of points per dimension of each grid, at least 3 for the
+            refinements to reduce the spacing.
+        resolution (float): Target spacing of the grid, as a fraction of each interval width.
+        nb_refined_points (int): Number of worst points whose cell is refined at each level.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        seed (int, optional): Base seed, the `i`-th evaluated point is reset with `seed + i`.
+        n_workers (int): Number of worker processes, 1 evaluates in the current process.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_bounds)` with every
+            evaluated point, in evaluation order. Use `worst_case` to get the worst point.
+    """
+    # A cell meshed again with 2 points per dimension keeps the same spacing
+    if nb_mesh_dim < 3:
+        raise ValueError(f"nb_mesh_dim must be at least 3, got {nb_mesh_dim}")
+    param_names = list(param_bounds.keys())
+    low = np.array([bound[0] for bound in param_bounds.values()], dtype=np.float64)
+    high = np.array([bound[1] for bound in param_bounds.values()], dtype=np.float64)
+    spacing = (high - low) / (nb_mesh_dim - 1)
+
+    evaluator = PointEvaluator(
+        policy,
+        modified_env,
+        param_names,
+        pool_size=pool_size,
+        n_workers=n_workers,
+        mp_context=mp_context,
+    )
+    boxes = [(low, high)]
+    evaluated: set[tuple[float, ...]] = set()
+    results: list[np.ndarray] = []
+    nb_evaluated = 0
+    with evaluator:
+        while True:
+            new_points = []
+            for box_low, box_high in boxes:
+                for point in _grid(box_low, box_high, nb_mesh_dim):
+                    key = tuple(np.round(point, 12).tolist())
+                    if key not in evaluated:
+                        evaluated.add(key)
+                        new_points.append(point)
+            if not new_points:
+                # The refined cells are already meshed, refining them again is a no-op
+                break
+            results.append(
+                evaluator.evaluate(
+                    np.array(new_points),
+                    seed=None if seed is None else seed + nb_evaluated,
+                )
+            )
+            nb_evaluated += len(new_points)
+
+            if np.all(spacing <= resolution * (high - low)):
+                break
+
+            all_results = np.concatenate(results)
+            worst_indices = np.argsort(all_results["return"], kind="stable")
+            worst_points = [
+                np.array([all_results[name][index] for name in param_names])
+                for index in worst_indices[:nb_refined_points]
+            ]
+            boxes = [
+                (
+                    np.clip(point - spacing / 2, low, high),
+                    np.clip(point + spacing / 2, low, high),
+                )
+                for point in worst_points
+            ]
+            spacing = spacing / (nb_mesh_dim - 1)
+
+    return np.concatenate(results)
+
+
+def cem_worst_case_search(
+    policy: Policy,
+    modified_env: Callable[[], ModifiedParamsEnv],
+    param_bounds: dict[str, Annotated[list[float], 2]],
+    budget: int = 1000,
+    population_size: int = 50,
+    elite_fraction: float = 0.2,
+    init_std: float = 0.3,
+    min_std: float = 0.01,
+    pool_size: int = 1,
+    seed: int | None = None,
+    n_workers: int = 1,
+    mp_context: BaseContext | None = None,
+) -> np.ndarray:
+    """
+    Search the worst-case parameters of `policy` with the cross-entropy method. At each
+    generation a population is drawn from a diagonal Gaussian over the params bound,
+    evaluated on a fixed pool of environments, and the Gaussian is refitted on the
+    `elite_fraction` of the population with the lowest returns. The search stops once
+    `budget` episodes have been run, which makes it usable on uncertainty sets too large
+    to be meshed, e.g. all the masses of the Ant.
+
+    The Gaussian lives in the params bound normalized to [0, 1], so `init_std` and `min_std`
+    are fractions of the width of each interval.
+
+    Args:
+        policy (Policy): A function mapping an observation to an action.
+        modified_env (Callable[[], ModifiedParamsEnv]): A function that returns a modified environment.
+        param_bounds (dict[str, Annotated[list[float], 2]]): Parameter boundaries.
+        budget (int): Total number of episodes.
+        population_size (int): Number of points evaluated per generation.
+        elite_fraction (float): Fraction of the population used to refit the Gaussian.
+        init_std (float): Initial standard deviation of the Gaussian, centered on the bound.
+        min_std (float): Lower bound of the standard deviation, avoids an early collapse.
+        pool_size (int): Number of environments reused across the points by each worker
+            process. The points being evaluated one after the other, a single environment is
+            used with `n_workers=1`.
+        seed (int, optional): Seed of the sampling, the `i`-th evaluated point is reset with `seed + i`.
+        n_workers (int): Number of worker processes evaluating each population.
+        mp_context (BaseContext, optional): Multiprocessing context of the worker processes.
+
+    Returns:
+        np.ndarray: A structured array of dtype `results_dtype(param_bounds)` with every
+            evaluated point, in evaluation order. Use `worst_case` to get the worst point.
+    """
+    param_names = list(param_bounds.keys())
+    low = np.array([bound[0] for bound in param_bounds.values()], dtype=np.float64)
+    high = np.array([bound[1] for bound in param_bounds.values()], dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    mean = np.full(len(param_names), 0.5)
+    std = np.full(len(param_names), init_std)
+
+    results: list[np.ndarray] = []
+    nb_evaluated = 0
+    with PointEvaluator(
+        policy,
+        modified_env,
+        param_names,
+        pool_size=pool_size,
+        n_workers=n_workers,
+        mp_context=mp_context,
+    ) as evaluator:
+        while nb_evaluated < budget:
+            nb_points = min(population_size, budget - nb_evaluated)
+            population = np.clip(
+                rng.normal(mean, std, size=(nb_points, len(param_names))), 0.0, 1.0
+            )
+            generation = evaluator.evaluate(
+                low + population * (high - low),
+                seed=None if seed is None else seed + nb_evaluated,
+            )
+            results.append(generation)
+            nb_evaluated += nb_points
+
+            nb_elites = max(1, int(elite_fraction * nb_points))
+            elites = population[np.argsort(generation["return"])[:nb_elites]]
+            mean = elites.mean(axis=0)
+            std = np.maximum(elites.std(axis=0), min_std)
+
+    return np.concatenate(results)
+
+
+EVALUATION_ROBUST_ANT_1D = EvaluationSet(
     modified_env=RobustAnt,  # type: ignore
     param_bounds=AntParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_ANT_2D = generate_evaluation_set(
+EVALUATION_ROBUST_ANT_2D = EvaluationSet(
     modified_env=RobustAnt,  # type: ignore
     param_bounds=AntParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_ANT_3D = generate_evaluation_set(
+EVALUATION_ROBUST_ANT_3D = EvaluationSet(
     modified_env=RobustAnt,  # type: ignore
     param_bounds=AntParamsBound.THREE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HUMANOID_STANDUP_1D = generate_evaluation_set(
+EVALUATION_ROBUST_HUMANOID_STANDUP_1D = EvaluationSet(
     modified_env=RobustHumanoidStandUp,  # type: ignore
     param_bounds=HumanoidStandupParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HUMANOID_STANDUP_2D = generate_evaluation_set(
+EVALUATION_ROBUST_HUMANOID_STANDUP_2D = EvaluationSet(
     modified_env=RobustHumanoidStandUp,  # type: ignore
     param_bounds=HumanoidStandupParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HUMANOID_STANDUP_3D = generate_evaluation_set(
+EVALUATION_ROBUST_HUMANOID_STANDUP_3D = EvaluationSet(
     modified_env=RobustHumanoidStandUp,  # type: ignore
     param_bounds=HumanoidStandupParamsBound.THREE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_WALKER_1D = generate_evaluation_set(
+EVALUATION_ROBUST_WALKER_1D = EvaluationSet(
     modified_env=RobustWalker2d,  # type: ignore
     param_bounds=Walker2dParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_WALKER_2D = generate_evaluation_set(
+EVALUATION_ROBUST_WALKER_2D = EvaluationSet(
     modified_env=RobustWalker2d,  # type: ignore
     param_bounds=Walker2dParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_WALKER_3D = generate_evaluation_set(
+EVALUATION_ROBUST_WALKER_3D = EvaluationSet(
     modified_env=RobustWalker2d,  # type: ignore
     param_bounds=Walker2dParamsBound.THREE_DIM.value,
     nb_mesh_dim=10,
 )
-EVALUATION_ROBUST_HALF_CHEETAH_1D = generate_evaluation_set(
+EVALUATION_ROBUST_HALF_CHEETAH_1D = EvaluationSet(
     modified_env=RobustHalfCheetah,  # type: ignore
     param_bounds=HalfCheetahParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HALF_CHEETAH_2D = generate_evaluation_set(
+EVALUATION_ROBUST_HALF_CHEETAH_2D = EvaluationSet(
     modified_env=RobustHalfCheetah,  # type: ignore
     param_bounds=HalfCheetahParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HALF_CHEETAH_3D = generate_evaluation_set(
+EVALUATION_ROBUST_HALF_CHEETAH_3D = EvaluationSet(
     modified_env=RobustHalfCheetah,  # type: ignore
     param_bounds=HalfCheetahParamsBound.THREE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_INVERTED_PENDULUM_1D = generate_evaluation_set(
+EVALUATION_ROBUST_INVERTED_PENDULUM_1D = EvaluationSet(
     modified_env=RobustInvertedPendulum,  # type: ignore
     param_bounds=InvertedPendulumParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_INVERTED_PENDULUM_2D = generate_evaluation_set(
+EVALUATION_ROBUST_INVERTED_PENDULUM_2D = EvaluationSet(
     modified_env=RobustInvertedPendulum,  # type: ignore
     param_bounds=InvertedPendulumParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HOPPER_1D = generate_evaluation_set(
+EVALUATION_ROBUST_HOPPER_1D = EvaluationSet(
     modified_env=RobustHopper,  # type: ignore
     param_bounds=HopperParamsBound.ONE_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HOPPER_2D = generate_evaluation_set(
+EVALUATION_ROBUST_HOPPER_2D = EvaluationSet(
     modified_env=RobustHopper,  # type: ignore
     param_bounds=HopperParamsBound.TWO_DIM.value,
     nb_mesh_dim=10,
 )
 
-EVALUATION_ROBUST_HOPPER_3D = generate_evaluation_set(
+EVALUATION_ROBUST_HOPPER_3D = EvaluationSet(
     modified_env=RobustHopper,  # type: ignore
     param_bounds=HopperParamsBound.THREE_DIM.value,
     nb_mesh_dim=10,
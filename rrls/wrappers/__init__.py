@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from .adversarial import DynamicAdversarial
+from .adversarial import DynamicAdversarial, VectorDynamicAdversarial
 from .domain_randomization import DomainRandomization
 from .probabilistic_action_robust import ProbabilisticActionRobust
 
-__all__ = ["DynamicAdversarial", "DomainRandomization", "ProbabilisticActionRobust"]
+__all__ = [
+    "DynamicAdversarial",
+    "DomainRandomization",
+    "ProbabilisticActionRobust",
+    "VectorDynamicAdversarial",
+]
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import gymnasium as gym
 import numpy as np
+from gymnasium.vector.utils import batch_space
 
 from rrls._interface import ModifiedParamsEnv
 
+if TYPE_CHECKING:
+    from rrls.envs import RobustVectorEnv
+
+
+def _unnormalize(
+    action: np.ndarray, low: np.ndarray, width: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    # low + (action + 1) * (high - low) / 2, in the preallocated buffer `out`
+    np.copyto(out, action)
+    out += 1.0
+    out *= width
+    out /= 2
+    out += low
+    return out
+
 
 class DynamicAdversarial(gym.Wrapper):
     """
@@ -26,9 +42,21 @@ class DynamicAdversarial(gym.Wrapper):
     (which is simply the negative of the agent's reward) is added to the info dictionary.
 
     The environment parameters are reset to their default values at the start of each episode.
+
+    The adversarial action is unnormalized with one numpy expression on bounds precomputed at
+    construction, and written with `set_params_array` when the environment provides it, the
+    parameters out of `params_bound` keeping their current value.
+
+    With `decision_interval=k`, the adversary acts every `k` steps of the episode, starting
+    with the first one, and the parameters are held in between: the adversarial action of the
+    other steps is ignored, and may be None. `is_decision_step` tells whether the next step
+    reads the adversarial action, so that the adversary is only queried at decision points.
     Args:
         env (ModifiedParamsEnv): The base environment, which must comply with the `ModifiedParams` protocol.
         params_bound (dict): Dictionary specifying the bounds for each parameter that can be modified.
+        count_steps (bool): If True, `episode_steps` and `total_steps` count the steps of the
+            current episode and since construction.
+        decision_interval (int): The number of steps each adversarial action is held for.
 
     """
 
@@ -36,7 +64,13 @@ class DynamicAdversarial(gym.Wrapper):
         self,
         env: ModifiedParamsEnv,
         params_bound: dict[str, Annotated[tuple[float], 2]],
+        count_steps: bool = False,
+        decision_interval: int = 1,
     ):
+        if decision_interval < 1:
+            raise ValueError(
+                f"decision_interval must be at least 1, got {decision_interval}"
+            )
         super().__init__(env)
         self.action_space = gym.spaces.Tuple(
             (
@@ -49,6 +83,28 @@ class DynamicAdversarial(gym.Wrapper):
         self.params_bound = params_bound
         self.defaut_params = env.get_params()
         self.env = env
+        self.count_steps = count_steps
+        self.episode_steps = 0
+        self.total_steps = 0
+        self.decision_interval = decision_interval
+        self.is_decision_step = True
+        self._held_steps = 0
+
+        self._param_names = list(params_bound.keys())
+        bounds = np.array(
+            [params_bound[name] for name in self._param_names], dtype=np.float64
+        )
+        self._low = bounds[:, 0].copy()
+        self._width = bounds[:, 1] - bounds[:, 0]
+        self._unnormalized = np.empty(len(self._param_names), dtype=np.float64)
+        # Positions of the bounded parameters in the parameters array of the env, if any
+        self._positions: np.ndarray | None = None
+        if hasattr(env, "set_params_array") and hasattr(env, "param_names"):
+            self._positions = np.array(
+                [env.param_names.index(name) for name in self._param_names],
+                dtype=np.intp,
+            )
+            self._params = env.get_params_array()
 
     def step(self, action):
         """
@@ -65,18 +121,30 @@ class DynamicAdversarial(gym.Wrapper):
         action_nature: np.ndarray  # type: ignore
         action_agent, action_nature = action
 
-        # Apply nature action to the environment
-        action_nature: dict[str, float] = {  # type: ignore
-            k: v for k, v in zip(self.params_bound.keys(), action_nature)
-        }
-        unnormalized_action_nature = self._unnormalize_action_nature(action_nature)
-
-        self.env.set_params(**unnormalized_action_nature)
+        # Apply nature action to the environment, at decision steps only
+        if self.is_decision_step:
+            unnormalized_action_nature = self._unnormalize_action_nature(action_nature)
+            if self._positions is not None:
+                params = self.env.get_params_array(out=self._params)  # type: ignore
+                params[self._positions] = unnormalized_action_nature
+                self.env.set_params_array(params)  # type: ignore
+            else:
+                self.env.set_params(
+                    **dict(zip(self._param_names, unnormalized_action_nature.tolist()))
+                )
+        else:
+            unnormalized_action_nature = self._unnormalized
+        self._held_steps += 1
+        self.is_decision_step = self._held_steps % self.decision_interval == 0
 
         # Apply agent action to the environment
         obs, reward, terminated, truncated, info = self.env.step(action_agent)
 
-        info.update(unnormalized_action_nature)
+        if self.count_steps:
+            self.episode_steps += 1
+            self.total_steps += 1
+
+        info.update(zip(self._param_names, unnormalized_action_nature.tolist()))
         # Float cast is for typing issue because reward is SupportsFloat type
         info.update({"adversarial_reward": -float(reward)})
         return obs, reward, terminated, truncated, info
@@ -93,22 +161,118 @@ class DynamicAdversarial(gym.Wrapper):
             Tuple: A tuple containing the initial observation and additional info.
         """
         self.env.set_params(**self.defaut_params)  # type: ignore
+        self.episode_steps = 0
+        self._held_steps = 0
+        self.is_decision_step = True
 
         obs, info = super().reset(seed=seed, options=options)
         info.update(self.env.get_params())  # type: ignore
         return obs, info
 
-    def _unnormalize_action_nature(self, action_nature: dict[str, float]):
-        action_nature_unnormalized = {}
-        for k, v in action_nature.items():
-            action_nature_unnormalized[k] = (
-                self.params_bound[k][0]
-                + ((v - (-1)) * (self.params_bound[k][1] - self.params_bound[k][0])) / 2  # type: ignore
-            )
-        return action_nature_unnormalized
+    def _unnormalize_action_nature(self, action_nature: np.ndarray) -> np.ndarray:
+        return _unnormalize(action_nature, self._low, self._width, self._unnormalized)
 
     def set_params(self, **kwargs):
         self.env.set_params(**kwargs)
 
     def get_params(self):
         return self.env.get_params()
+
+
+class VectorDynamicAdversarial(gym.vector.VectorWrapper):
+    """
+    The `VectorDynamicAdversarial` class is the `DynamicAdversarial` wrapper of a vector
+    environment with a parameters matrix, e.g. `rrls.envs.RobustVectorEnv`, for adversaries
+    batched over the sub-environments.
+
+    The action is a tuple of the agent actions, of shape `(num_envs, act_dim)`, and of the
+    adversarial actions, of shape `(num_envs, len(params_bound))` and normalized to [-1, 1].
+    On each step, the adversarial actions of all the sub-environments are unnormalized and
+    written to the parameters matrix in one batched operation. The adversarial rewards, the
+    negative of the agent rewards, are returned as an array of shape `(num_envs,)` under the
+    `"adversarial_reward"` key of the infos, which is overwritten by the next step.
+
+    The parameters of the sub-environments are reset to their value at construction on reset.
+    Args:
+        env (RobustVectorEnv): The base vector environment, which must provide `param_names`,
+            `set_params_array` and `get_params_array`.
+        params_bound (dict): Dictionary specifying the bounds for each parameter that can be modified.
+    """
+
+    def __init__(
+        self,
+        env: RobustVectorEnv,
+        params_bound: dict[str, Annotated[tuple[float], 2]],
+    ):
+        super().__init__(env)
+        self.params_bound = params_bound
+        self.single_action_space = gym.spaces.Tuple(
+            (
+                env.single_action_space,
+                gym.spaces.Box(low=-1, high=1, shape=(len(params_bound),)),
+            )
+        )
+        self.action_space = batch_space(self.single_action_space, env.num_envs)
+
+        param_names = list(params_bound.keys())
+        bounds = np.array(
+            [params_bound[name] for name in param_names], dtype=np.float64
+        )
+        self._low = bounds[:, 0].copy()
+        self._width = bounds[:, 1] - bounds[:, 0]
+        self._positions = np.array(
+            [env.param_names.index(name) for name in param_names], dtype=np.intp
+        )
+        self._default_params = env.get_params_array()
+        self._params = env.get_params_array()
+        self._unnormalized = np.empty(
+            (env.num_envs, len(param_names)), dtype=np.float64
+        )
+        self._adversarial_rewards = np.empty(env.num_envs, dtype=np.float64)
+
+    def step(self, actions):
+        """
+        Steps the sub-environments with the given agent and adversarial actions, modifying
+        their parameters accordingly.
+
+        Args:
+            actions (tuple): The agent actions and the adversarial actions.
+
+        Returns:
+            Tuple: The observations, the agent rewards, the terminations, the truncations and
+            the infos, holding the adversarial rewards.
+        """
+        actions_agent, actions_nature = actions
+
+        # The bounds are broadcast over the sub-environments
+        unnormalized = _unnormalize(
+            actions_nature, self._low, self._width, self._unnormalized
+        )
+        params = self.env.get_params_array(out=self._params)
+        params[:, self._positions] = unnormalized
+        self.env.set_params_array(params)
+
+        obs, rewards, terminations, truncations, infos = self.env.step(actions_agent)
+        np.negative(rewards, out=self._adversarial_rewards)
+        infos["adversarial_reward"] = self._adversarial_rewards
+        return obs, rewards, terminations, truncations, infos
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict | None = None,
+    ):
+        """
+        Resets the sub-environments, including resetting their parameters to their values at
+        construction.
+
+        Args:
+            seed (int | list[int | None], optional): Seeds of the sub-environments.
+            options (dict, optional): Additional options for resetting the environments.
+
+        Returns:
+            Tuple: The observations and the infos.
+        """
+        self.env.set_params_array(self._default_params)
+        return self.env.reset(seed=seed, options=options)
@@ -15,15 +15,26 @@ class DomainRandomization(gym.Wrapper):
 
     This class wraps an environment that follows the `ModifiedParamsEnv` protocol.
 
+    When the environment provides `set_params_array`, the uniform randomization writes each
+    pre-drawn set of parameters with it, the parameters out of `params_bound` keeping their
+    current value, and `params` is only built as a dict when read.
+
     Args:
         env (ModifiedParamsEnv): The environment to be wrapped.
         randomize_fn (Callable): A function that takes the parameter boundaries as input and returns
             a new set of parameters. If None, a uniform randomization is used.
+        block_size (int): The number of sets of parameters drawn at once by the uniform
+            randomization, consumed one per episode.
+        seed (int, optional): Seed of the random number generator of the uniform randomization.
+            It is reseeded by `reset(seed=...)`, from a stream independent of the one of the
+            environment, so that wrappers seeded differently, e.g. the sub-environments of a
+            vector environment, draw independent and reproducible parameters.
 
     Attributes:
         env (ModifiedParamsEnv): The environment to be wrapped.
         params_bound (dict): Parameter boundaries.
         params (dict): Current parameters.
+        params_rng (np.random.Generator): Random number generator of the uniform randomization.
     """
 
     def __init__(
@@ -33,28 +44,62 @@ class DomainRandomization(gym.Wrapper):
         randomize_fn: (
             Callable[[dict[str, Annotated[tuple[float], 2]]], dict[str, float]] | None
         ) = None,
+        block_size: int = 4096,
+        seed: int | None = None,
     ):
         super().__init__(env)
         self.env = env
         self.params_bound = params_bound
 
+        self._param_names = list(params_bound.keys())
+        bounds = np.array(
+            [params_bound[name] for name in self._param_names], dtype=np.float64
+        )
+        self._low = bounds[:, 0].copy()
+        self._width = bounds[:, 1] - bounds[:, 0]
+        # Parameters drawn in advance, one row per episode, consumed from `_block_index`
+        self._block = np.empty((block_size, len(self._param_names)), dtype=np.float64)
+        self._block_index = block_size
+        self.seed_params_rng(seed)
+
         # If no randomize_fn is provided, use the uniform one
         self.randomize_fn: Callable[
             [dict[str, Annotated[tuple[float], 2]]], dict[str, float]
         ] = (randomize_fn if randomize_fn is not None else self.draw_params_uniform)
 
         self.draw_params = randomize_fn
-        self.params = self.randomize_fn(self.params_bound)
+        # Positions of the bounded parameters in the parameters array of the env, if the
+        # uniform randomization can write them with `set_params_array`
+        self._positions: np.ndarray | None = None
+        if (
+            randomize_fn is None
+            and hasattr(env, "set_params_array")
+            and hasattr(env, "param_names")
+        ):
+            self._positions = np.array(
+                [env.param_names.index(name) for name in self._param_names],
+                dtype=np.intp,
+            )
+            self._params_array = env.get_params_array()
+        self._draw_params()
 
     def reset(self, *, seed: int | None = None, options: dict | None = None):
         """
-        Resets the environment and draws a new set of parameters.
+        Resets the environment and draws a new set of parameters, after reseeding the random
+        number generator of the parameters if `seed` is given.
 
         Returns:
             obj: The initial observation from the environment.
         """
-        self.params = self.randomize_fn(self.params_bound)
-        self.env.set_params(**self.params)
+        if seed is not None:
+            self.seed_params_rng(seed)
+        self._draw_params()
+        if self._positions is not None:
+            params = self.env.get_params_array(out=self._params_array)  # type: ignore
+            params[self._positions] = self._row
+            self.env.set_params_array(params)  # type: ignore
+        else:
+            self.env.set_params(**self._params)
         return self.env.reset(seed=seed, options=options)
 
     def step(self, action):
@@ -69,14 +114,58 @@ class DomainRandomization(gym.Wrapper):
         """
         return self.env.step(action)
 
+    @property
+    def params(self) -> dict[str, float]:
+        if self._params is None:
+            self._params = dict(zip(self._param_names, self._row.tolist()))
+        return self._params
+
+    @params.setter
+    def params(self, params: dict[str, float]):
+        self._params = params
+
+    def _draw_params(self):
+        if self._positions is not None:
+            # The dict of the parameters is only built if `params` is read
+            self._row = self._next_params_row()
+            self._params = None
+        else:
+            self._params = self.randomize_fn(self.params_bound)
+
+    def _next_params_row(self) -> np.ndarray:
+        if self._block_index == len(self._block):
+            # low + uniform * (high - low), drawn into the preallocated block
+            self.params_rng.random(out=self._block)
+            self._block *= self._width
+            self._block += self._low
+            self._block_index = 0
+        row = self._block[self._block_index]
+        self._block_index += 1
+        return row
+
+    def seed_params_rng(self, seed: int | None = None):
+        """
+        Reseeds the random number generator of the uniform randomization, discarding the
+        parameters drawn in advance.
+
+        Args:
+            seed (int, optional): The seed, None seeding from fresh entropy.
+        """
+        # Child of the seed sequence of the environment, for an independent stream
+        self.params_rng = np.random.default_rng(
+            np.random.SeedSequence(seed).spawn(1)[0]
+        )
+        self._block_index = len(self._block)
+
     def draw_params_uniform(
         self, parameters_space: dict[str, Annotated[tuple[float], 2]]
     ):
-        low = np.array([bound[0] for bound in parameters_space.values()])
-        high = np.array([bound[1] for bound in parameters_space.values()])  # type: ignore
-        params_draw = np.random.uniform(low, high)
-        new_params = dict(zip(parameters_space.keys(), params_draw))
-        return new_params
+        if parameters_space is not self.params_bound:
+            low = np.array([bound[0] for bound in parameters_space.values()])
+            high = np.array([bound[1] for bound in parameters_space.values()])  # type: ignore
+            params_draw = self.params_rng.uniform(low, high)
+            return dict(zip(parameters_space.keys(), params_draw.tolist()))
+        return dict(zip(self._param_names, self._next_params_row().tolist()))
 
     def set_params(self, **params):
         self.params = params
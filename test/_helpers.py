@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import gymnasium as gym
+
+
+class DictParamsEnv(gym.Wrapper):
+    # Env complying with the ModifiedParams protocol without the parameters array API
+    def set_params(self, **kwargs):
+        self.env.set_params(**kwargs)
+
+    def get_params(self):
+        return self.env.get_params()
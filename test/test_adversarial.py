@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import gymnasium as gym
+import numpy as np
 import pytest
+from _helpers import DictParamsEnv
 
 import rrls  # noqa: F401
+from rrls.envs import HopperParamsBound, RobustHopper, RobustVectorEnv
+from rrls.wrappers import DynamicAdversarial, VectorDynamicAdversarial
 
 adversarial_envs = []
 envs = gym.envs.registry  # pyright: ignore
@@ -51,6 +55,96 @@ def _unnormalize_action_nature(
     action_nature_unnormalized = {}
     for k, v in action_nature.items():
         action_nature_unnormalized[k] = (
-            params_bound[k][0] + ((v - (-1)) * (params_bound[k][1] - params_bound[k][0])) / 2  # type: ignore
+            params_bound[k][0] + ((float(v) - (-1)) * (params_bound[k][1] - params_bound[k][0])) / 2  # type: ignore
         )
     return action_nature_unnormalized
+
+
+def test_step_counter():
+    env = DynamicAdversarial(
+        RobustHopper(), HopperParamsBound.THREE_DIM.value, count_steps=True
+    )
+    env.reset(seed=0)
+    for _ in range(3):
+        env.step(env.action_space.sample())
+    assert (env.episode_steps, env.total_steps) == (3, 3)
+    env.reset(seed=0)
+    env.step(env.action_space.sample())
+    assert (env.episode_steps, env.total_steps) == (1, 4)
+
+
+def test_array_and_dict_parameter_writes_match():
+    params_bound = HopperParamsBound.THREE_DIM.value
+    env = DynamicAdversarial(RobustHopper(), params_bound)
+    dict_env = DynamicAdversarial(DictParamsEnv(RobustHopper()), params_bound)
+    assert env._positions is not None and dict_env._positions is None
+    env.reset(seed=0)
+    dict_env.reset(seed=0)
+    for _ in range(5):
+        action = env.action_space.sample()
+        _, _, _, _, info = env.step(action)
+        _, _, _, _, dict_info = dict_env.step(action)
+        assert env.get_params() == dict_env.get_params()
+        assert info == dict_info
+        for name, (low, high) in params_bound.items():
+            assert low <= info[name] <= high
+
+
+def test_vector_adversarial_matches_single_envs():
+    num_envs = 3
+    params_bound = HopperParamsBound.THREE_DIM.value
+    vector_env = VectorDynamicAdversarial(
+        RobustVectorEnv(RobustHopper, num_envs), params_bound
+    )
+    single_envs = [
+        DynamicAdversarial(RobustHopper(), params_bound) for _ in range(num_envs)
+    ]
+    assert vector_env.action_space[1].shape == (num_envs, len(params_bound))
+
+    obs, _ = vector_env.reset(seed=0)
+    for i, env in enumerate(single_envs):
+        single_obs, _ = env.reset(seed=i)
+        np.testing.assert_array_equal(obs[i], single_obs)
+    vector_env.action_space.seed(0)
+    for _ in range(5):
+        actions, actions_nature = vector_env.action_space.sample()
+        obs, rewards, _, _, infos = vector_env.step((actions, actions_nature))
+        assert infos["adversarial_reward"].shape == (num_envs,)
+        params = vector_env.env.get_params_array()
+        for i, env in enumerate(single_envs):
+            single_obs, reward, _, _, info = env.step((actions[i], actions_nature[i]))
+            np.testing.assert_array_equal(obs[i], single_obs)
+            assert rewards[i] == reward
+            assert infos["adversarial_reward"][i] == info["adversarial_reward"]
+            np.testing.assert_array_equal(params[i], env.env.get_params_array())
+
+
+def test_decision_interval_holds_params():
+    params_bound = HopperParamsBound.THREE_DIM.value
+    env = DynamicAdversarial(RobustHopper(), params_bound, decision_interval=3)
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    decisions = []
+    for step in range(7):
+        decisions.append(env.is_decision_step)
+        action, action_nature = env.action_space.sample()
+        if not env.is_decision_step:
+            action_nature = None
+        writes = env.env.model_writes
+        params = env.get_params()
+        _, _, _, _, info = env.step((action, action_nature))
+        if not decisions[-1]:
+            assert env.get_params() == params
+            assert env.env.model_writes == writes
+        for name in params_bound:
+            assert info[name] == env.get_params()[name]
+    assert decisions == [True, False, False, True, False, False, True]
+    env.reset(seed=0)
+    assert env.is_decision_step
+
+
+def test_invalid_decision_interval():
+    with pytest.raises(ValueError):
+        DynamicAdversarial(
+            RobustHopper(), HopperParamsBound.ONE_DIM.value, decision_interval=0
+        )
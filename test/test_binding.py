@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+
+import gymnasium.envs.mujoco
+import mujoco
+import numpy as np
+import pytest
+from gymnasium.wrappers import TimeLimit
+
+import rrls.envs._base
+from rrls.envs import (
+    ForceAnt,
+    ForceHalfCheetah,
+    ForceHopper,
+    ForceHumanoidStandUp,
+    ForceInvertedPendulum,
+    ForceWalker2d,
+    RobustAnt,
+    RobustHalfCheetah,
+    RobustHopper,
+    RobustHumanoidStandUp,
+    RobustInvertedPendulum,
+    RobustWalker2d,
+)
+
+env_classes = [
+    RobustAnt,
+    RobustHalfCheetah,
+    RobustHopper,
+    RobustHumanoidStandUp,
+    RobustInvertedPendulum,
+    RobustWalker2d,
+    ForceAnt,
+    ForceHalfCheetah,
+    ForceHopper,
+    ForceHumanoidStandUp,
+    ForceInvertedPendulum,
+    ForceWalker2d,
+]
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_binding_writes_every_parameter(env_cls):
+    env = env_cls()
+    params = {name: 1.0 + i for i, name in enumerate(env._binding.param_names)}
+    assert set(params) == set(env.get_params())
+    env.set_params(**params)
+    for name, (target, index) in env._binding.table.items():
+        struct, array = target.split(".")
+        index = rrls.envs._base._resolve(env.unwrapped.model, array, index)
+        values = getattr(getattr(env.unwrapped, struct), array)[index]
+        assert np.all(values == params[name]), name
+
+
+@pytest.mark.parametrize(
+    "env_cls", [cls for cls in env_classes if cls.__name__.startswith("Force")]
+)
+def test_binding_skips_unset_forces(env_cls):
+    env = env_cls()
+    first, second = env._binding.param_names[:2]
+    env.set_params(**{first: 1.0, second: 2.0})
+    env.set_params(**{first: 3.0})
+    for name, value in ((first, 3.0), (second, 2.0)):
+        target, index = env._binding.table[name]
+        index = rrls.envs._base._resolve(env.unwrapped.model, "xfrc_applied", index)
+        assert env.unwrapped.data.xfrc_applied[index] == value
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_params_array_round_trip(env_cls):
+    env = env_cls()
+    assert list(env_cls.param_names) == list(env.get_params())
+    values = np.arange(1.0, len(env_cls.param_names) + 1.0)
+    env.set_params_array(values)
+    assert env.get_params() == dict(zip(env_cls.param_names, values.tolist()))
+    out = np.empty(len(env_cls.param_names))
+    assert env.get_params_array(out) is out
+    assert np.array_equal(out, values)
+
+    for name, value in zip(env_cls.param_names, values):
+        target, index = env._binding.table[name]
+        struct, array = target.split(".")
+        index = rrls.envs._base._resolve(env.unwrapped.model, array, index)
+        assert np.all(getattr(getattr(env.unwrapped, struct), array)[index] == value)
+
+
+def test_copied_env_writes_to_its_own_model():
+    env = RobustHopper()
+    env.set_params(torsomass=1.0)
+    copied_env = deepcopy(env)
+    copied_env.set_params(torsomass=2.0)
+    assert env.unwrapped.model.body_mass[1] == 1.0
+    assert copied_env.unwrapped.model.body_mass[1] == 2.0
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_info_params_modes(env_cls):
+    params = {name: 1.0 for name in env_cls.param_names}
+
+    env = env_cls(info_params="reset")
+    _, info = env.reset(seed=0, options=params)
+    assert info[env_cls.param_names[0]] == 1.0
+    _, _, _, _, info = env.step(env.action_space.sample())
+    assert env_cls.param_names[0] not in info
+
+    env = env_cls(info_params="none")
+    _, info = env.reset(seed=0, options=params)
+    assert env_cls.param_names[0] not in info
+
+    env = env_cls(info_params="array")
+    _, info = env.reset(seed=0, options=params)
+    view = info["params"]
+    assert not view.flags.writeable
+    np.testing.assert_array_equal(view, np.ones(len(env_cls.param_names)))
+    env.set_params_array(np.full(len(env_cls.param_names), 2.0))
+    _, _, _, _, info = env.step(env.action_space.sample())
+    assert info["params"] is view
+    np.testing.assert_array_equal(view, np.full(len(env_cls.param_names), 2.0))
+
+
+def test_info_params_invalid():
+    with pytest.raises(ValueError):
+        RobustAnt(info_params="always")
+
+
+def test_unchanged_params_are_not_written():
+    env = RobustHopper()
+    env.reset(seed=0)
+    assert env.model_writes == 0
+    env.set_params(torsomass=2.0)
+    writes = env.model_writes
+    assert writes > 0
+    env.set_params(torsomass=2.0)
+    assert env.model_writes == writes
+    env.set_params(thighmass=3.0)
+    assert env.model_writes == writes + 1
+    assert env.unwrapped.model.body_mass[2] == 3.0
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_partial_change_writes_changed_params(env_cls):
+    env = env_cls()
+    env.reset(seed=0)
+    params = np.arange(1.0, len(env_cls.param_names) + 1.0)
+    env.set_params_array(params)
+    writes = env.model_writes
+    changed = params.copy()
+    changed[::2] += 10.0
+    env.set_params_array(changed)
+    nb_changed = 0
+    for i, (name, value) in enumerate(zip(env_cls.param_names, changed.tolist())):
+        target, index = env._binding.table[name]
+        struct, array = target.split(".")
+        index = rrls.envs._base._resolve(env.unwrapped.model, array, index)
+        values = getattr(getattr(env.unwrapped, struct), array)[index]
+        assert np.all(values == value), name
+        if i % 2 == 0:
+            nb_changed += np.size(values)
+    assert env.model_writes - writes == nb_changed
+
+
+def test_forces_are_written_again_after_reset():
+    env = ForceHopper()
+    env.reset(seed=0)
+    env.set_params(torsoforce_x=1.0)
+    assert env.model_writes == 1
+    env.reset(seed=0)
+    # The force zeroed by the reset of MuJoCo is written again
+    assert env.model_writes == 1
+    assert env.unwrapped.data.xfrc_applied[1, 0] == 1.0
+    env.set_params(torsoforce_x=1.0)
+    assert env.model_writes == 1
+    env.set_params(torsoforce_x=2.0)
+    assert env.model_writes == 2
+    assert env.unwrapped.data.xfrc_applied[1, 0] == 2.0
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_indices_resolved_once_per_model(env_cls, monkeypatch):
+    env_cls()
+
+    def fail(*args):
+        raise AssertionError("name lookup on a cached model")
+
+    monkeypatch.setattr(rrls.envs._base, "_name2id", fail)
+    env = env_cls()
+    env.set_params_array(np.ones(len(env_cls.param_names)))
+
+
+def test_unknown_body_name():
+    binding = rrls.envs._base.ParamsBinding(
+        {"mass": ("model.body_mass", "no_such_body")}
+    )
+    with pytest.raises(ValueError):
+        binding.bind(RobustHopper().unwrapped)
+
+
+def test_custom_xml_resolves_bodies_by_name(tmp_path):
+    xml = Path(gymnasium.envs.mujoco.__file__).parent / "assets" / "hopper.xml"
+    # An extra body before the torso shifts the index of every body of the robot
+    marker = '<body name="marker" pos="0 0 5"><geom size="0.01" contype="0" conaffinity="0"/></body>'
+    xml_file = tmp_path / "hopper.xml"
+    xml_file.write_text(
+        xml.read_text().replace('<body name="torso"', marker + '<body name="torso"')
+    )
+
+    env = RobustHopper(xml_file=str(xml_file))
+    env.set_params(torsomass=7.0, footmass=8.0)
+    model = env.unwrapped.model
+    assert model.body("torso").id == 2
+    assert model.body_mass[model.body("torso").id] == 7.0
+    assert model.body_mass[model.body("foot").id] == 8.0
+    assert model.body_mass[model.body("marker").id] != 7.0
+
+
+@pytest.mark.parametrize("env_cls", env_classes)
+def test_fast_construction_matches_gym_make(env_cls):
+    env = env_cls()
+    fast_env = env_cls(fast=True)
+    assert isinstance(fast_env.env, TimeLimit)
+    assert fast_env.spec.id == env.spec.id
+    np.testing.assert_array_equal(fast_env.reset(seed=0)[0], env.reset(seed=0)[0])
+    for _ in range(20):
+        action = env.action_space.sample()
+        outputs = env.step(action)
+        fast_outputs = fast_env.step(action)
+        np.testing.assert_array_equal(fast_outputs[0], outputs[0])
+        assert fast_outputs[1:4] == outputs[1:4]
+
+
+def test_fast_construction_max_episode_steps():
+    env = RobustHopper(fast=True, max_episode_steps=3)
+    env.reset(seed=0)
+    truncated = [env.step(np.zeros(env.action_space.shape))[3] for _ in range(3)]
+    assert truncated == [False, False, True]
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_models_are_copied_from_compiled_template(fast, monkeypatch):
+    RobustWalker2d(fast=fast)
+
+    def fail(*args):
+        raise AssertionError("XML compiled again")
+
+    monkeypatch.setattr(mujoco.MjModel, "from_xml_path", fail)
+    env = RobustWalker2d(fast=fast)
+    other_env = RobustWalker2d(fast=fast)
+    model, other_model = env.unwrapped.model, other_env.unwrapped.model
+    assert model is not other_model
+    np.testing.assert_array_equal(model.body_mass, other_model.body_mass)
+    env.set_params(torsomass=10.0)
+    assert other_model.body_mass[1] != 10.0
+    assert "_initialize_simulation" not in vars(env.unwrapped)
+
+
+@pytest.mark.parametrize("size", [(320, 240), (1024, 768)])
+def test_template_offscreen_size_matches_gymnasium(size):
+    width, height = size
+    env = RobustHopper(fast=True, width=width, height=height)
+    expected = gymnasium.make("Hopper-v5", width=width, height=height).unwrapped.model
+    assert env.unwrapped.model.vis.global_.offwidth == expected.vis.global_.offwidth
+    assert env.unwrapped.model.vis.global_.offheight == expected.vis.global_.offheight
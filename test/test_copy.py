@@ -47,3 +47,57 @@ def test_change_params_is_effective(env):
         assert done_copied == done
         assert truncated_copied == truncated
         step_number += 1
+
+
+@pytest.mark.parametrize(
+    "env_id",
+    [
+        "rrls/robust-ant-v0",
+        "rrls/robust-halfcheetah-v0",
+        "rrls/robust-hopper-v0",
+        "rrls/robust-invertedpendulum-v0",
+        "rrls/robust-humanoidstandup-v0",
+        "rrls/robust-walker-v0",
+        "rrls/force-ant-v0",
+        "rrls/force-halfcheetah-v0",
+        "rrls/force-hopper-v0",
+        "rrls/force-invertedpendulum-v0",
+        "rrls/force-humanoidstandup-v0",
+        "rrls/force-walker-v0",
+    ],
+)
+def test_set_state_restores_trajectory(env_id):
+    # An env restored from a snapshot should follow the same trajectory as the original env
+    env = gym.make(env_id)
+    restored_env = gym.make(env_id)
+    env.reset(seed=0)
+    restored_env.reset(seed=1)
+    env.set_params_array(np.linspace(0.5, 1.5, len(env.param_names)))
+    for _ in range(10):
+        env.step(env.action_space.sample())
+    restored_env.set_state(env.get_state())
+    np.testing.assert_array_equal(
+        restored_env.get_params_array(), env.get_params_array()
+    )
+    for step_number in range(200):
+        action = env.action_space.sample()
+        state_original, reward, done, truncated, _ = env.step(action)
+        restored_state, restored_reward, restored_done, restored_truncated, _ = (
+            restored_env.step(action)
+        )
+        assert np.array_equal(
+            restored_state, state_original
+        ), f" states are different at step_number: {step_number}"
+        assert restored_reward == reward
+        assert (restored_done, restored_truncated) == (done, truncated)
+        if done or truncated:
+            break
+    # The random generator is restored too, so the next resets match
+    assert np.array_equal(restored_env.reset()[0], env.reset()[0])
+
+
+def test_set_state_rejects_other_model():
+    with pytest.raises(ValueError):
+        gym.make("rrls/robust-hopper-v0").set_state(
+            gym.make("rrls/robust-ant-v0").get_state()
+        )
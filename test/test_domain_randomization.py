@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import gymnasium as gym
 import pytest
+from _helpers import DictParamsEnv
 
 import rrls  # noqa: F401
+from rrls.envs import HopperParamsBound, RobustHopper
+from rrls.wrappers import DomainRandomization
 
 dr_envs = []
 envs = gym.envs.registry  # pyright: ignore
@@ -20,3 +23,41 @@ def test_run_multiple_episode(env):
     while not done and not truncated:
         action = env.action_space.sample()
         _, _, done, truncated, _ = env.step(action)
+
+
+def _draw_episodes(env, seed, n_episodes):
+    env.reset(seed=seed)
+    params = [env.get_params()]
+    for _ in range(n_episodes - 1):
+        env.reset()
+        params.append(env.get_params())
+    return params
+
+
+def test_seeded_params_are_reproducible():
+    params_bound = HopperParamsBound.THREE_DIM.value
+    env = DomainRandomization(RobustHopper(), params_bound, block_size=4)
+    other_env = DomainRandomization(RobustHopper(), params_bound, block_size=3)
+    params = _draw_episodes(env, 0, 10)
+    # The stream does not depend on the size of the blocks
+    assert _draw_episodes(other_env, 0, 10) == params
+    assert _draw_episodes(env, 0, 10) == params
+    assert env.env.get_params()["torsomass"] == params[-1]["torsomass"]
+    assert _draw_episodes(env, 1, 10) != params
+    for episode_params in params:
+        for name, (low, high) in params_bound.items():
+            assert low <= episode_params[name] <= high
+
+
+def test_array_and_dict_parameter_writes_match():
+    params_bound = HopperParamsBound.THREE_DIM.value
+    env = DomainRandomization(RobustHopper(), params_bound)
+    dict_env = DomainRandomization(DictParamsEnv(RobustHopper()), params_bound)
+    assert env._positions is not None and dict_env._positions is None
+    for seed in [0, None, None]:
+        env.reset(seed=seed)
+        dict_env.reset(seed=seed)
+        # The dict of the parameters is only built when read
+        assert env._params is None
+        assert env.env.get_params() == dict_env.env.get_params()
+        assert env.get_params() == dict_env.get_params()
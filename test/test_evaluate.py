@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from rrls.envs import (
+    ForceHopper,
+    HopperParamsBound,
+    InvertedPendulumParamsBound,
+    RobustHopper,
+    RobustInvertedPendulum,
+)
+from rrls.evaluate import (
+    EVALUATION_ROBUST_ANT_3D,
+    EvaluationSet,
+    QuasiRandomEvaluationSet,
+    ResultsStore,
+    _LazyEvaluationSet,
+    adaptive_worst_case_search,
+    cem_worst_case_search,
+    evaluate_mesh,
+    evaluate_points,
+    evaluate_points_cached,
+    evaluate_points_lockstep,
+    generate_evaluation_set,
+    iter_evaluate_points,
+    policy_fingerprint,
+    quasi_random_points,
+    return_below,
+    rollout,
+    time_budget,
+    worst_case,
+)
+
+QUADRATIC_TARGET = {"a": 0.3, "b": 0.7}
+QUADRATIC_BOUNDS = {"a": [0.0, 1.0], "b": [0.0, 1.0]}
+
+
+class QuadraticEnv(gym.Env):
+    """
+    One step environment whose reward is the squared distance between its parameters and
+    `QUADRATIC_TARGET`, the worst case is reached at the target.
+    """
+
+    observation_space = gym.spaces.Box(low=-1.0, high=1.0, shape=(1,))
+    action_space = gym.spaces.Box(low=-1.0, high=1.0, shape=(1,))
+
+    def __init__(self, a: float = 0.0, b: float = 0.0):
+        self.set_params(a=a, b=b)
+
+    def set_params(self, a: float | None = None, b: float | None = None):
+        self.a = a if a is not None else self.a
+        self.b = b if b is not None else self.b
+
+    def get_params(self):
+        return {"a": self.a, "b": self.b}
+
+    def reset(self, *, seed: int | None = None, options: dict | None = None):
+        super().reset(seed=seed)
+        if options is not None:
+            self.set_params(**options)
+        return np.zeros(1, dtype=np.float32), {}
+
+    def step(self, action):
+        reward = sum(
+            (v - QUADRATIC_TARGET[k]) ** 2 for k, v in self.get_params().items()
+        )
+        return np.zeros(1, dtype=np.float32), reward, True, False, {}
+
+
+def test_evaluation_set_is_lazy():
+    assert len(EVALUATION_ROBUST_ANT_3D) == 10**3
+    calls = []
+
+    def make_env(**params):
+        calls.append(params)
+        return RobustHopper(**params)
+
+    eval_set = EvaluationSet(
+        modified_env=make_env,  # type: ignore
+        param_bounds=HopperParamsBound.THREE_DIM.value,
+        nb_mesh_dim=10,
+    )
+    assert len(eval_set) == 10**3
+    assert calls == []
+    env = eval_set[-1]
+    assert len(calls) == 1
+    assert env.get_params() == {
+        **env.get_params(),
+        **eval_set.params(len(eval_set) - 1),
+    }
+
+
+def test_lazy_evaluation_set_requires_points():
+    class PartialEvaluationSet(_LazyEvaluationSet):
+        def __len__(self):
+            return 0
+
+        def params(self, index):
+            return {}
+
+    with pytest.raises(TypeError):
+        PartialEvaluationSet()  # type: ignore
+
+
+def test_evaluation_set_matches_generate_evaluation_set():
+    param_bounds = HopperParamsBound.TWO_DIM.value
+    eager = generate_evaluation_set(RobustHopper, param_bounds, nb_mesh_dim=3)  # type: ignore
+    lazy = EvaluationSet(RobustHopper, param_bounds, nb_mesh_dim=3)  # type: ignore
+    assert len(eager) == len(lazy)
+    for eager_env, lazy_env in zip(eager, lazy):
+        assert eager_env.get_params() == lazy_env.get_params()
+        assert np.array_equal(
+            eager_env.unwrapped.model.body_mass, lazy_env.unwrapped.model.body_mass
+        )
+
+
+def _zero_policy(obs):
+    return np.zeros(1)
+
+
+def test_evaluate_mesh_reuses_pool():
+    param_bounds = InvertedPendulumParamsBound.TWO_DIM.value
+    built = []
+
+    def make_env(**params):
+        env = RobustInvertedPendulum(**params)
+        built.append(env)
+        return env
+
+    results = evaluate_mesh(
+        _zero_policy, make_env, param_bounds, nb_mesh_dim=3, pool_size=2, seed=0  # type: ignore
+    )
+    # The points are evaluated one after the other in the current process
+    assert len(built) == 1
+    assert results.dtype.names == (*param_bounds.keys(), "return", "length", "seed")
+    assert len(results) == 9
+    assert np.array_equal(results["seed"], np.arange(9))
+
+    # Reconfiguring a reused environment gives the same episode as a fresh one
+    fresh_envs = generate_evaluation_set(RobustInvertedPendulum, param_bounds, nb_mesh_dim=3)  # type: ignore
+    for index, env in enumerate(fresh_envs):
+        episode_return, length = rollout(
+            _zero_policy, env, env.get_params(), seed=index
+        )
+        assert results["return"][index] == episode_return
+        assert results["length"][index] == length
+
+
+def test_evaluate_mesh_parallel_matches_serial():
+    param_bounds = InvertedPendulumParamsBound.TWO_DIM.value
+    serial = evaluate_mesh(_zero_policy, RobustInvertedPendulum, param_bounds, nb_mesh_dim=4, seed=0)  # type: ignore
+    parallel = evaluate_mesh(
+        _zero_policy,
+        RobustInvertedPendulum,  # type: ignore
+        param_bounds,
+        nb_mesh_dim=4,
+        seed=0,
+        n_workers=2,
+        chunk_size=3,
+    )
+    assert np.array_equal(serial, parallel)
+
+
+def test_evaluate_points_applies_forces():
+    def hopper_policy(obs):
+        return np.zeros(3)
+
+    param_names = ["torsoforce_x", "torsoforce_y"]
+    points = np.array([[-300.0, 0.0], [0.0, 0.0], [300.0, 0.0]])
+    results = evaluate_points(
+        hopper_policy, ForceHopper, param_names, points, seed=0  # type: ignore
+    )
+    assert len(set(results["return"].tolist())) == len(points)
+    env = ForceHopper()
+    assert rollout(hopper_policy, env, {"torsoforce_x": -300.0}, seed=0) != rollout(
+        hopper_policy, env, {"torsoforce_x": 300.0}, seed=0
+    )
+
+
+def test_adaptive_worst_case_search():
+    results = adaptive_worst_case_search(
+        _zero_policy, QuadraticEnv, QUADRATIC_BOUNDS, resolution=1 / 64  # type: ignore
+    )
+    # A full mesh at the same resolution would cost 65**2 episodes
+    assert len(results) < 100
+    worst_params, worst_return = worst_case(results)
+    assert worst_return == results["return"].min()
+    for name, value in worst_params.items():
+        assert abs(value - QUADRATIC_TARGET[name]) <= 1 / 64
+
+
+def test_adaptive_worst_case_search_smallest_mesh():
+    results = adaptive_worst_case_search(
+        _zero_policy,
+        QuadraticEnv,  # type: ignore
+        QUADRATIC_BOUNDS,
+        nb_mesh_dim=3,
+        resolution=0.1,
+    )
+    worst_params, _ = worst_case(results)
+    for name, value in worst_params.items():
+        assert abs(value - QUADRATIC_TARGET[name]) <= 0.1
+    with pytest.raises(ValueError):
+        adaptive_worst_case_search(
+            _zero_policy, QuadraticEnv, QUADRATIC_BOUNDS, nb_mesh_dim=2  # type: ignore
+        )
+
+
+def test_cem_worst_case_search():
+    results = cem_worst_case_search(
+        _zero_policy,
+        QuadraticEnv,  # type: ignore
+        QUADRATIC_BOUNDS,
+        budget=300,
+        population_size=30,
+        seed=0,
+    )
+    assert len(results) == 300
+    worst_params, _ = worst_case(results)
+    for name, value in worst_params.items():
+        assert abs(value - QUADRATIC_TARGET[name]) <= 0.05
+
+
+@pytest.mark.parametrize("method", ["halton", "lhs"])
+def test_quasi_random_points(method):
+    param_bounds = {f"p{i}": [float(i), float(i) + 2.0] for i in range(13)}
+    points = quasi_random_points(param_bounds, 64, method=method, seed=0)
+    assert points.shape == (64, 13)
+    low = np.arange(13)
+    assert np.all(points >= low) and np.all(points <= low + 2.0)
+    # Each dimension is covered evenly: one point per stratum of width 2 / 64
+    strata = np.floor((points - low) / 2.0 * 64).astype(int)
+    if method == "lhs":
+        for axis in range(13):
+            assert np.array_equal(np.sort(strata[:, axis]), np.arange(64))
+    assert np.array_equal(
+        points, quasi_random_points(param_bounds, 64, method=method, seed=0)
+    )
+
+
+def test_quasi_random_evaluation_set():
+    param_bounds = HopperParamsBound.THREE_DIM.value
+    eval_set = QuasiRandomEvaluationSet(RobustHopper, param_bounds, nb_points=16)  # type: ignore
+    assert len(eval_set) == 16
+    assert eval_set.points().shape == (16, 3)
+    env = eval_set[3]
+    assert {k: env.get_params()[k] for k in param_bounds} == eval_set.params(3)
+
+
+def test_evaluate_points_lockstep_matches_evaluate_points():
+    param_bounds = InvertedPendulumParamsBound.TWO_DIM.value
+    points = quasi_random_points(param_bounds, 10)
+    batch_sizes = []
+
+    def batch_policy(observations):
+        batch_sizes.append(observations.shape)
+        return -observations[:, :1]
+
+    lockstep = evaluate_points_lockstep(
+        batch_policy, RobustInvertedPendulum, list(param_bounds), points, nb_envs=4, seed=0  # type: ignore
+    )
+    serial = evaluate_points(
+        lambda obs: batch_policy(obs[None])[0],
+        RobustInvertedPendulum,  # type: ignore
+        list(param_bounds),
+        points,
+        seed=0,
+    )
+    assert np.array_equal(lockstep, serial)
+    assert batch_sizes[0] == (4, 4)
+
+
+def test_evaluate_points_cached_resumes(tmp_path):
+    param_names = list(QUADRATIC_BOUNDS)
+    points = quasi_random_points(QUADRATIC_BOUNDS, 20)
+    policy_id = policy_fingerprint(np.zeros(3), "checkpoint-0")
+    nb_episodes = []
+
+    def counting_policy(obs):
+        nb_episodes.append(1)
+        return _zero_policy(obs)
+
+    path = tmp_path / "results.sqlite"
+    with ResultsStore(path) as store:
+        # Interrupted evaluation, only the first half of the points is done
+        evaluate_points_cached(
+            counting_policy, QuadraticEnv, param_names, points[:10], store, policy_id, "quadratic"  # type: ignore
+        )
+    assert len(nb_episodes) == 10
+
+    with ResultsStore(path) as store:
+        results = evaluate_points_cached(
+            counting_policy, QuadraticEnv, param_names, points, store, policy_id, "quadratic"  # type: ignore
+        )
+        assert len(nb_episodes) == 20
+        expected = evaluate_points(_zero_policy, QuadraticEnv, param_names, points, seed=0)  # type: ignore
+        assert np.array_equal(results, expected)
+        stored = store.results(policy_id, "quadratic", param_names)
+        assert np.array_equal(np.sort(stored, order="seed"), expected)
+        assert (
+            len(store.results(policy_fingerprint("other"), "quadratic", param_names))
+            == 0
+        )
+
+
+def test_iter_evaluate_points_early_stopping():
+    param_names = list(QUADRATIC_BOUNDS)
+    points = quasi_random_points(QUADRATIC_BOUNDS, 100)
+    streamed = list(
+        iter_evaluate_points(
+            _zero_policy, QuadraticEnv, param_names, points, stop=return_below(0.05)  # type: ignore
+        )
+    )
+    assert 0 < len(streamed) < len(points)
+    assert [index for index, _ in streamed] == list(range(len(streamed)))
+    assert streamed[-1][1]["return"] < 0.05
+    assert all(result["return"] >= 0.05 for _, result in streamed[:-1])
+
+    streamed = list(
+        iter_evaluate_points(
+            _zero_policy, QuadraticEnv, param_names, points, stop=time_budget(0.0)  # type: ignore
+        )
+    )
+    assert len(streamed) == 1
+
+
+def test_iter_evaluate_points_parallel():
+    param_bounds = InvertedPendulumParamsBound.TWO_DIM.value
+    points = quasi_random_points(param_bounds, 8)
+    expected = evaluate_points(_zero_policy, RobustInvertedPendulum, list(param_bounds), points, seed=0)  # type: ignore
+    streamed = dict(
+        iter_evaluate_points(
+            _zero_policy, RobustInvertedPendulum, list(param_bounds), points, seed=0, n_workers=2  # type: ignore
+        )
+    )
+    assert sorted(streamed) == list(range(8))
+    for index, result in streamed.items():
+        assert result == expected[index]
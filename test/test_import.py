@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+# Generous budgets: `import rrls` should only cost the gymnasium import and the
+# environment registration, never building a MuJoCo environment.
+IMPORT_TIME_BUDGET_S = 5.0
+IMPORT_MAX_RSS_BUDGET_MB = 300.0
+
+_IMPORT_SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+import rrls  # noqa: F401
+elapsed = time.perf_counter() - start
+
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in bytes on macOS and in kilobytes on Linux
+max_rss_mb = max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+print(json.dumps({
+    "elapsed": elapsed,
+    "max_rss_mb": max_rss_mb,
+    "modules": [name for name in sys.modules if name.startswith("rrls")],
+}))
+"""
+
+
+def _import_rrls_in_subprocess() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_submodules():
+    result = _import_rrls_in_subprocess()
+    assert result["modules"] == ["rrls"]
+
+
+def test_import_budget():
+    result = _import_rrls_in_subprocess()
+    assert result["elapsed"] < IMPORT_TIME_BUDGET_S
+    assert result["max_rss_mb"] < IMPORT_MAX_RSS_BUDGET_MB
+
+
+def test_lazy_attributes():
+    import rrls
+
+    assert rrls.envs.RobustAnt.__name__ == "RobustAnt"
+    assert rrls.wrappers.DynamicAdversarial.__name__ == "DynamicAdversarial"
+    assert rrls.generate_evaluation_set is rrls.evaluate.generate_evaluation_set
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from rrls.envs import (
+    ForceHopper,
+    ForcePulse,
+    RobustHopper,
+    RobustVectorEnv,
+    compile_force_schedule,
+)
+
+
+def test_compile_force_schedule():
+    env = ForceHopper()
+    model = env.unwrapped.model
+    pulses = [
+        ForcePulse("torso", [1.0, 0.0, 0.0, 0.0, 0.0, 0.0], start=2, duration=3),
+        ForcePulse("foot", [0.0, 0.0, 2.0, 0.0, 0.0, 0.0], start=1, period=4),
+    ]
+    schedule = compile_force_schedule(model, pulses, horizon=10)
+    assert schedule.shape == (10, model.nbody, 6)
+    np.testing.assert_array_equal(schedule[:, 1, 0], [0, 0, 1, 1, 1, 0, 0, 0, 0, 0])
+    np.testing.assert_array_equal(schedule[:, 4, 2], [0, 2, 0, 0, 0, 2, 0, 0, 0, 2])
+    assert np.count_nonzero(schedule) == 6
+
+
+def test_force_schedule_is_applied_by_step():
+    env = ForceHopper()
+    nbody = env.unwrapped.model.nbody
+    schedule = np.zeros((3, nbody, 6))
+    schedule[:, 1, 0] = [1.0, 2.0, 3.0]
+    env.reset(seed=0, options={"force_schedule": schedule, "torsoforce_x": 5.0})
+    xfrc_applied = env.unwrapped.data.xfrc_applied
+    for expected in [1.0, 2.0, 3.0, 3.0]:
+        env.step(env.action_space.sample())
+        assert xfrc_applied[1, 0] == expected
+    # The schedule restarts with the episode
+    env.reset(seed=0)
+    env.step(env.action_space.sample())
+    assert xfrc_applied[1, 0] == 1.0
+    # Without a schedule, the parameters give the forces again
+    env.set_force_schedule(None)
+    assert xfrc_applied[1, 0] == 5.0
+    # Forces of unset parameters are removed with the schedule
+    schedule[:, 1, 1] = 4.0
+    env.reset(seed=0, options={"force_schedule": schedule, "torsoforce_x": 5.0})
+    env.step(env.action_space.sample())
+    assert xfrc_applied[1, 1] == 4.0
+    env.set_force_schedule(None)
+    env.step(env.action_space.sample())
+    assert xfrc_applied[1, 0] == 5.0
+    assert xfrc_applied[1, 1] == 0.0
+
+
+def test_force_schedule_is_removed_from_robust_env():
+    env = RobustHopper()
+    pulses = [ForcePulse("torso", [50.0, 0.0, 0.0, 0.0, 0.0, 0.0], duration=2)]
+    env.reset(seed=0, options={"force_schedule": pulses})
+    xfrc_applied = env.unwrapped.data.xfrc_applied
+    env.step(env.action_space.sample())
+    assert xfrc_applied[1, 0] == 50.0
+    env.set_force_schedule(None)
+    for _ in range(3):
+        env.step(env.action_space.sample())
+        assert not xfrc_applied.any()
+
+
+def test_force_schedule_changes_the_trajectory():
+    env = ForceHopper()
+    obs, _ = env.reset(seed=0)
+    pulses = [ForcePulse("torso", [50.0, 0.0, 0.0, 0.0, 0.0, 0.0], start=0, duration=5)]
+    pushed_obs, _ = env.reset(seed=0, options={"force_schedule": pulses})
+    np.testing.assert_array_equal(pushed_obs, obs)
+    action = np.zeros(env.action_space.shape)
+    pushed_obs = env.step(action)[0]
+    env.set_force_schedule(None)
+    env.reset(seed=0)
+    assert not np.array_equal(env.step(action)[0], pushed_obs)
+
+
+@pytest.mark.parametrize("max_episode_steps", [None, 1000])
+def test_set_state_restores_schedule_step(max_episode_steps):
+    env = ForceHopper(fast=True, max_episode_steps=max_episode_steps)
+    branch = ForceHopper(fast=True, max_episode_steps=max_episode_steps)
+    assert (env._time_limit() is None) == (max_episode_steps is None)
+    schedule = np.zeros((10, env.unwrapped.model.nbody, 6))
+    schedule[:, 1, 0] = np.arange(10) * 20.0
+    action = np.zeros(env.action_space.shape)
+    env.reset(seed=0, options={"force_schedule": schedule})
+    branch.reset(seed=1, options={"force_schedule": schedule})
+    for _ in range(6):
+        branch.step(action)
+    for _ in range(3):
+        env.step(action)
+    snapshot = env.get_state()
+    branch.set_state(snapshot)
+    for _ in range(4):
+        obs = env.step(action)[0]
+        branch_obs = branch.step(action)[0]
+        np.testing.assert_array_equal(branch_obs, obs)
+        assert branch.unwrapped.data.xfrc_applied[1, 0] == (
+            env.unwrapped.data.xfrc_applied[1, 0]
+        )
+
+
+def test_force_schedule_in_vector_env():
+    vector_env = RobustVectorEnv(ForceHopper, 2)
+    env = ForceHopper()
+    pulses = [ForcePulse("foot", [0.0, 0.0, 10.0, 0.0, 0.0, 0.0], period=3)]
+    vector_env.envs[1].set_force_schedule(pulses)
+    env.reset(seed=1, options={"force_schedule": pulses})
+    vector_env.reset(seed=0)
+    actions = np.zeros(vector_env.action_space.shape)
+    for _ in range(10):
+        obs = env.step(actions[1])[0]
+        vector_obs = vector_env.step(actions)[0]
+        np.testing.assert_array_equal(vector_obs[1], obs)
+
+
+def test_invalid_force_schedule():
+    env = ForceHopper()
+    with pytest.raises(ValueError):
+        env.set_force_schedule(np.zeros((10, 2, 6)))
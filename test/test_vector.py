@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from rrls.envs import ForceHopper, RobustHalfCheetah, RobustHopper, RobustVectorEnv
+
+
+@pytest.mark.parametrize("env_cls", [RobustHopper, ForceHopper])
+def test_vector_env_matches_sync_vector_env(env_cls):
+    num_envs = 3
+    rng = np.random.default_rng(0)
+    params = np.stack([env_cls().get_params_array() for _ in range(num_envs)])
+    params[:, :2] = rng.uniform(0.5, 2.0, (num_envs, 2))
+    envs = [env_cls() for _ in range(num_envs)]
+    sync_env = gym.vector.SyncVectorEnv([lambda env=env: env for env in envs])
+    vector_env = RobustVectorEnv(env_cls, num_envs, params=params)
+
+    obs, _ = sync_env.reset(seed=0)
+    vector_obs, _ = vector_env.reset(seed=0)
+    np.testing.assert_array_equal(vector_obs, obs)
+    nb_dones = 0
+    for _ in range(200):
+        # The forces of the single envs are reset with the episode, set them at every step
+        for env, env_params in zip(envs, params):
+            env.set_params_array(env_params)
+        actions = rng.uniform(-1.0, 1.0, vector_env.action_space.shape)
+        outputs = sync_env.step(actions)
+        vector_outputs = vector_env.step(actions)
+        for output, vector_output in zip(outputs[:4], vector_outputs[:4]):
+            np.testing.assert_array_equal(vector_output, output)
+        nb_dones += vector_outputs[2].sum()
+    # Some episodes ended, so the autoreset was exercised
+    assert nb_dones > 0
+
+
+def test_vector_env_params_matrix():
+    vector_env = RobustVectorEnv(RobustHalfCheetah, 2)
+    params = vector_env.get_params_array()
+    assert params.shape == (2, len(RobustHalfCheetah.param_names))
+    params[1, 1] = 2.5  # torsomass
+    vector_env.reset(seed=0, options={"params": params})
+    np.testing.assert_array_equal(vector_env.get_params_array(), params)
+    assert vector_env.envs[0].torsomass != 2.5
+    assert vector_env.envs[1].torsomass == 2.5
+    assert vector_env.envs[1].unwrapped.model.body_mass[1] == 2.5
+    assert vector_env.envs[0].unwrapped.model is not vector_env.envs[1].unwrapped.model
+
+
+def test_vector_env_reuses_buffers():
+    vector_env = RobustVectorEnv(RobustHopper, 2)
+    obs, _ = vector_env.reset(seed=0)
+    step_obs, rewards, _, _, _ = vector_env.step(
+        np.zeros(vector_env.action_space.shape)
+    )
+    assert step_obs is obs
+    assert step_obs.shape == (2,) + vector_env.single_observation_space.shape
+    assert rewards.shape == (2,)
+
+    vector_env = RobustVectorEnv(RobustHopper, 2, copy=True)
+    obs, _ = vector_env.reset(seed=0)
+    step_obs, _, _, _, _ = vector_env.step(np.zeros(vector_env.action_space.shape))
+    assert step_obs is not obs
+
+
+def test_threaded_vector_env_matches_serial():
+    num_envs = 5
+    serial_env = RobustVectorEnv(RobustHopper, num_envs)
+    threaded_env = RobustVectorEnv(RobustHopper, num_envs, n_threads=2, copy=True)
+    assert [len(indices) for indices in threaded_env._slices] == [2, 3]
+
+    np.testing.assert_array_equal(
+        threaded_env.reset(seed=0)[0], serial_env.reset(seed=0)[0]
+    )
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        actions = rng.uniform(-1.0, 1.0, serial_env.action_space.shape)
+        outputs = serial_env.step(actions)
+        threaded_outputs = threaded_env.step(actions)
+        for output, threaded_output in zip(outputs[:4], threaded_outputs[:4]):
+            np.testing.assert_array_equal(threaded_output, output)
+    threaded_env.close()